@@ -0,0 +1,168 @@
+"""
+Build Nimble Encounter Builder into a standalone executable.
+
+Usage:
+    python build.py [spec|advanced|basic]
+
+Commands:
+    spec      Check dependencies, generate the spec file and build (default).
+    advanced  Generate the spec file and build without the dependency check.
+    basic     Build straight from PyInstaller command-line options (one
+              folder by default; NIMBLE_BUILD_ONEFILE=1 for a single .exe).
+
+Environment switches (set to 1): NIMBLE_BUILD_CLEAN, NIMBLE_BUILD_CONSOLE,
+NIMBLE_BUILD_UPX, NIMBLE_BUILD_VERBOSE, NIMBLE_BUILD_SHARED_CACHE,
+NIMBLE_BUILD_ONEFILE.
+
+Requirements:
+    pip install pyinstaller pyside6-essentials
+"""
+
+import argparse
+import os
+import sys
+
+from build_common import (
+    BUILD_NAME,
+    PROJECT_ROOT,
+    UPX_EXCLUDE,
+    build_from_spec,
+    check_dependencies,
+    collect_inputs,
+    create_spec_file,
+    env_flag,
+    release_build,
+    run_pyinstaller,
+    supports_optimize,
+)
+
+
+def _banner(title):
+    print("=" * 70)
+    print(title)
+    print("=" * 70)
+    print()
+
+
+def _report_success(exe_path, onefile=True):
+    print()
+    _banner("BUILD SUCCESSFUL!")
+    if onefile:
+        print(f"Executable created: {exe_path}")
+        print()
+        print("Next steps:")
+        print("  1. Test the executable by running it")
+        print("  2. Create a distribution folder with:")
+        print(f"     - {exe_path.name}")
+        print("     - Bestiary folder (if you have one)")
+        print("     - Any config files you want to include")
+        print()
+        print("The executable is standalone and portable!")
+    else:
+        print(f"Application folder: {exe_path}")
+        print()
+        print("Distribute the whole folder; run the executable inside it.")
+    print()
+    return 0
+
+
+def _report_failure():
+    print()
+    _banner("BUILD FAILED!")
+    print("Troubleshooting:")
+    print("  1. Make sure PySide6 is installed: pip install pyside6-essentials")
+    print("  2. Make sure PyInstaller is installed: pip install pyinstaller")
+    print("  3. Try running: pip install --upgrade pyinstaller pyside6-essentials")
+    print("  4. Check that NimbleEncounterBuilder.py runs successfully before building")
+    print("  5. Set NIMBLE_BUILD_VERBOSE=1 to see the full PyInstaller output")
+    print()
+    return 1
+
+
+def build_spec(check_deps=True):
+    """Generate the spec file and build from it."""
+    pyside_path = None
+    if check_deps:
+        deps_ok, pyside_path = check_dependencies()
+        if not deps_ok:
+            return 1
+
+    print("Creating PyInstaller spec file...")
+    created = create_spec_file(pyside_path)
+    if not created:
+        return 1
+    spec_file, _app_name = created
+
+    if not build_from_spec(spec_file):
+        return _report_failure()
+    return _report_success(release_build(onefile=True))
+
+
+def build_basic():
+    """Build from command-line options without a spec file."""
+    inputs = collect_inputs(PROJECT_ROOT)
+    if not inputs.main_script.exists():
+        print(f"ERROR: Main script not found at {inputs.main_script}")
+        return 1
+
+    # One folder by default: faster to build and no unpack step at startup.
+    onefile = env_flag("NIMBLE_BUILD_ONEFILE")
+
+    args = [
+        "--onefile" if onefile else "--onedir",  # Single exe or app folder
+        "--windowed",                          # No console window (GUI app)
+        f"--name={BUILD_NAME}",                # Stable name keeps the work cache
+        "--hidden-import=PySide6",             # Ensure PySide6 is included
+        "--hidden-import=PySide6.QtCore",      # Qt Core module
+        "--hidden-import=PySide6.QtGui",       # Qt GUI module
+        "--hidden-import=PySide6.QtWidgets",   # Qt Widgets module
+        "--hidden-import=PySide6.QtUiTools",   # Qt UI Tools for .ui loading
+        "--hidden-import=shiboken6",           # PySide6 dependency
+    ]
+
+    # Needs PyInstaller 6.6+; older versions reject the option outright.
+    if supports_optimize():
+        args.append("--optimize=2")            # Strip asserts and docstrings
+
+    # UPX is slow and can corrupt Qt DLLs; only use it when asked for.
+    if env_flag("NIMBLE_BUILD_UPX"):
+        args.extend(f"--upx-exclude={name}" for name in UPX_EXCLUDE)
+    else:
+        args.append("--noupx")
+
+    # UI files, README and splash image
+    for src, dest in inputs.datas:
+        args.append(f"--add-data={src}{os.pathsep}{dest}")
+
+    if inputs.icon:
+        args.append(f"--icon={inputs.icon}")
+
+    args.append(str(inputs.main_script))
+
+    if not run_pyinstaller(args):
+        return _report_failure()
+    return _report_success(release_build(onefile=onefile), onefile=onefile)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Build Nimble Encounter Builder with PyInstaller."
+    )
+    parser.add_argument(
+        "command",
+        nargs="?",
+        default="spec",
+        choices=("spec", "advanced", "basic"),
+        help="build variant (default: spec)",
+    )
+    args = parser.parse_args(argv)
+
+    _banner(f"Nimble Encounter Builder - Build ({args.command})")
+
+    if args.command == "basic":
+        return build_basic()
+    return build_spec(check_deps=args.command == "spec")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
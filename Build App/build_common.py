@@ -0,0 +1,567 @@
+"""
+Shared build logic for Nimble Encounter Builder.
+
+Dependency checks, spec generation and the PyInstaller invocation live here
+so every build entry point (build.py and the legacy script names) applies
+the same options and caching.
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import importlib
+import importlib.util
+import os
+import pkgutil
+import re
+import shutil
+import subprocess
+import sys
+import sysconfig
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime
+from importlib import metadata
+from pathlib import Path
+from typing import Optional
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+DIST_DIR = PROJECT_ROOT.parent / "build"
+SPEC_FILE = Path(__file__).resolve().parent / "NimbleEncounterBuilder.spec"
+
+BUILD_NAME = "NimbleEncounterBuilder"
+EXE_SUFFIX = ".exe" if sys.platform == "win32" else ""
+
+# Used to join rendered lines inside f-string expressions.
+NEWLINE = "\n"
+
+# Qt libraries UPX is known to corrupt; skipped when UPX is enabled.
+UPX_EXCLUDE = ("Qt6WebEngineCore.dll", "Qt6Pdf.dll", "opengl32sw.dll")
+
+# pefile release known to keep PyInstaller's Windows DLL scan fast.
+PEFILE_VERSION = "2023.2.7"
+
+# Analysis(optimize=...) and --optimize need at least this PyInstaller.
+OPTIMIZE_MIN_PYINSTALLER = (6, 6)
+
+# PyInstaller output lines echoed while building; the rest is summarized.
+PROGRESS_PATTERN = re.compile(r"INFO: Building|INFO: checking|ERROR|WARNING")
+
+# Application packages whose submodules are listed as hidden imports.
+APP_PACKAGES = ("modules", "tabs")
+
+# Qt plugins bundled with the app, relative to the PySide6 package folder.
+# Only the platform integration is needed: the app uses the Fusion style,
+# which is built into QtWidgets, so no style plugins are copied.
+_QT_PLUGINS = {
+    "win32": ("plugins/platforms/qwindows.dll",),
+    "darwin": ("plugins/platforms/libqcocoa.dylib",),
+    "linux": ("plugins/platforms/libqxcb.so",),
+}
+
+
+# Spec snippet run after Analysis: PySide6's hook collects Qt translations,
+# QML and add-on libraries the app never loads, even with the excludes list.
+QT_DROP_FILTER = """\
+# Drop Qt data and libraries the app never loads.
+_drop = (
+    'translations/', 'qml/', 'Qt6WebEngine', 'Qt6Pdf', 'Qt6Quick', 'QtQuick',
+    'Qt6Qml', 'Qt63D', 'Qt6Multimedia', 'Qt6Charts', 'Qt6DataVisualization',
+    'QtDesigner',
+)
+a.datas = [d for d in a.datas if not any(s in d[0].replace('\\\\', '/') for s in _drop)]
+a.binaries = [b for b in a.binaries if not any(s in b[0].replace('\\\\', '/') for s in _drop)]
+"""
+
+
+def _posix(path: Path) -> str:
+    """Forward-slash form of a path, safe to embed in the generated spec."""
+    return path.as_posix()
+
+
+def _mtime_ns(path: Optional[Path]) -> int:
+    try:
+        return path.stat().st_mtime_ns if path else 0
+    except OSError:
+        return 0
+
+
+@dataclass(frozen=True)
+class BuildInputs:
+    """Source files bundled into the executable, with their mtimes."""
+
+    project_root: Path
+    main_script: Path
+    ui_dir: Path
+    main_ui: Path
+    ui_files: tuple[Path, ...]
+    readme: Optional[Path]
+    splash: Optional[Path]
+    icon: Optional[Path]
+    mtimes: tuple[tuple[str, int], ...]
+
+    @property
+    def datas(self) -> tuple[tuple[Path, str], ...]:
+        """(source, destination folder) pairs for PyInstaller's datas."""
+        entries = [(path, "uiDesign") for path in self.ui_files]
+        if self.readme:
+            entries.append((self.readme, "."))
+        if self.splash:
+            entries.append((self.splash, "."))
+        return tuple(entries)
+
+
+@functools.lru_cache(maxsize=None)
+def collect_inputs(project_root: Path) -> BuildInputs:
+    """Resolve and stat the build inputs once per process."""
+    ui_dir = project_root / "uiDesign"
+    main_ui = ui_dir / "nimbleHandy.ui"
+    ui_files = tuple(sorted(ui_dir.glob("*.ui"))) if ui_dir.exists() else ()
+    if not ui_files:
+        ui_files = (main_ui,)
+
+    def optional(name: str) -> Optional[Path]:
+        path = project_root / name
+        return path if path.exists() else None
+
+    main_script = project_root / "NimbleEncounterBuilder.py"
+    readme = optional("README.html")
+    splash = optional("EncounterBuilderAppImage.png")
+    icon = optional("EncounterBuilderIconImage.png")
+    tracked = (main_script, *ui_files, readme, splash, icon)
+    mtimes = tuple((_posix(path), _mtime_ns(path)) for path in tracked if path)
+
+    return BuildInputs(
+        project_root=project_root,
+        main_script=main_script,
+        ui_dir=ui_dir,
+        main_ui=main_ui,
+        ui_files=ui_files,
+        readme=readme,
+        splash=splash,
+        icon=icon,
+        mtimes=mtimes,
+    )
+
+
+def env_flag(name):
+    """True when an environment switch such as NIMBLE_BUILD_UPX is set to 1."""
+    return os.environ.get(name, "").strip() == "1"
+
+
+def _pyside_flavour():
+    """Return which PySide6 distribution is installed (essentials or full)."""
+    try:
+        metadata.version("PySide6_Addons")
+    except metadata.PackageNotFoundError:
+        return "pyside6-essentials"
+    return "PySide6 (full, includes add-ons not used by this app)"
+
+
+def _package_dir(name):
+    """Return a package's folder without importing it, or None if missing."""
+    try:
+        spec = importlib.util.find_spec(name)
+    except (ImportError, ValueError):
+        spec = None
+    if spec is not None and spec.origin:
+        return Path(spec.origin).parent
+    if spec is None:
+        return None
+    # Unusual loaders may not report an origin; fall back to a real import.
+    try:
+        module = importlib.import_module(name)
+    except ImportError:
+        return None
+    return Path(module.__file__).parent
+
+
+def _pyinstaller_version():
+    """Return PyInstaller's (major, minor) from package metadata, or None."""
+    try:
+        raw = metadata.version("pyinstaller")
+    except metadata.PackageNotFoundError:
+        return None
+    match = re.match(r"(\d+)\.(\d+)", raw)
+    return (int(match.group(1)), int(match.group(2))) if match else None
+
+
+def supports_optimize():
+    """True if the installed PyInstaller accepts optimize=2 / --optimize."""
+    version = _pyinstaller_version()
+    return version is not None and version >= OPTIMIZE_MIN_PYINSTALLER
+
+
+def _deps_stamp():
+    """Return (stamp_file, key) for the cached dependency check.
+
+    The key covers the interpreter and the site-packages folder mtime, which
+    changes whenever packages are installed or removed.
+    """
+    site_dir = Path(sysconfig.get_paths()["purelib"])
+    try:
+        site_mtime = site_dir.stat().st_mtime_ns
+    except OSError:
+        site_mtime = 0
+    key = hashlib.sha1(
+        f"{sys.executable}|{sys.version}|{site_mtime}".encode("utf-8")
+    ).hexdigest()
+    return DIST_DIR / ".deps-ok", key
+
+
+def check_dependencies():
+    """Check that required packages are installed.
+
+    A passing result is remembered in build/.deps-ok; delete it to force a
+    full re-check.
+    """
+    print("Checking dependencies...")
+
+    stamp_file, stamp_key = _deps_stamp()
+    try:
+        cached_key, cached_path = stamp_file.read_text(encoding="utf-8").splitlines()[:2]
+    except (OSError, ValueError):
+        cached_key = cached_path = None
+    if cached_key == stamp_key:
+        print("  [OK] Dependencies unchanged since last check")
+        print(f"       PySide6 location: {cached_path}")
+        print()
+        return True, Path(cached_path)
+
+    missing = []
+
+    if _package_dir("PyInstaller"):
+        print("  [OK] PyInstaller found")
+        if not supports_optimize():
+            needed = ".".join(map(str, OPTIMIZE_MIN_PYINSTALLER))
+            print(f"  [WARNING] PyInstaller {needed}+ is needed to strip asserts and docstrings;")
+            print("            building without it. pip install --upgrade pyinstaller")
+    else:
+        print("  [MISSING] PyInstaller not found")
+        missing.append("pyinstaller")
+
+    # Locate PySide6 without importing it, which would load the Qt libraries.
+    pyside_path = _package_dir("PySide6")
+    if pyside_path:
+        print(f"  [OK] PySide6 found ({_pyside_flavour()})")
+        print(f"       Location: {pyside_path}")
+    else:
+        print("  [MISSING] PySide6 not found")
+        missing.append("pyside6-essentials")
+
+    try:
+        pefile_version = metadata.version("pefile")
+    except metadata.PackageNotFoundError:
+        pefile_version = None
+    if pefile_version and pefile_version != PEFILE_VERSION:
+        print(f"  [WARNING] pefile {pefile_version} found; the binary scan may be slow.")
+        print(f"            pip install pefile=={PEFILE_VERSION}")
+
+    if missing:
+        print()
+        print("Missing dependencies! Install with:")
+        print(f"    pip install {' '.join(missing)}")
+        print()
+        return False, None
+
+    try:
+        stamp_file.parent.mkdir(parents=True, exist_ok=True)
+        stamp_file.write_text(f"{stamp_key}\n{pyside_path}\n", encoding="utf-8")
+    except OSError:
+        pass
+
+    print()
+    return True, pyside_path
+
+
+def release_build(onefile: bool = True) -> Path:
+    """Move the stable-named build output to its timestamped release name.
+
+    PyInstaller builds under a fixed name so its work cache survives between
+    runs; the human-readable timestamp is only applied to the final copy.
+    With onefile=False the output is the application folder.
+    """
+    timestamp = datetime.now().strftime("%H%M-%b%d-%Y")
+    suffix = EXE_SUFFIX if onefile else ""
+    built = DIST_DIR / f"{BUILD_NAME}{suffix}"
+    release = DIST_DIR / f"Nimble Encounter Builder {timestamp}{suffix}"
+    if release.is_dir():
+        shutil.rmtree(release)
+    elif release.exists():
+        release.unlink()
+    shutil.move(str(built), str(release))
+    return release
+
+
+def _app_modules(project_root: Path):
+    """List every submodule of the app's packages for hiddenimports."""
+    names = []
+    for pkg_name in APP_PACKAGES:
+        pkg_dir = project_root / pkg_name
+        names.extend(
+            info.name
+            for info in pkgutil.walk_packages([str(pkg_dir)], prefix=f"{pkg_name}.")
+        )
+    return sorted(names)
+
+
+def create_spec_file(pyside_path=None):
+    """Create an enhanced spec file with proper PySide6 handling.
+
+    Returns (spec_file, app_name), or None if a required input is missing.
+    Without pyside_path no Qt plugins are copied explicitly and PyInstaller's
+    PySide6 hook decides.
+    """
+    project_root = PROJECT_ROOT
+    app_name = BUILD_NAME
+    inputs = collect_inputs(project_root)
+    spec_file = SPEC_FILE
+
+    # Check required files
+    if not inputs.main_script.exists():
+        print(f"ERROR: Main script not found: {inputs.main_script}")
+        return None
+
+    if not inputs.main_ui.exists():
+        print(f"ERROR: UI file not found: {inputs.main_ui}")
+        return None
+
+    # Prepare paths for spec file (use forward slashes for cross-platform)
+    main_script_str = _posix(inputs.main_script)
+    project_root_str = _posix(project_root)
+
+    # Icon line (optional) keeps Windows build branded.
+    icon_line = f"icon='{_posix(inputs.icon)}',  # Application icon" if inputs.icon else ""
+
+    # Data files bundled into the app (UI, README, splash).
+    datas = [f"('{_posix(src)}', '{dest}')," for src, dest in inputs.datas]
+
+    # PySide6 binary includes
+    pyside_binaries = ""
+    plugins = [
+        pyside_path / rel
+        for rel in _QT_PLUGINS.get(sys.platform, ())
+        if pyside_path and (pyside_path / rel).exists()
+    ]
+    if plugins:
+        # Include only the Qt plugins the app needs
+        plugin_lines = []
+        for plugin in plugins:
+            plugin_str = _posix(plugin)
+            dest = _posix(plugin.parent.relative_to(pyside_path.parent))
+            plugin_lines.append(f"        ('{plugin_str}', '{dest}'),")
+        pyside_binaries = f"""
+    # PySide6 binaries and plugins
+    binaries=[
+{NEWLINE.join(plugin_lines)}
+    ],"""
+
+    debug_console = env_flag("NIMBLE_BUILD_CONSOLE")
+    use_upx = env_flag("NIMBLE_BUILD_UPX")
+    upx_exclude = list(UPX_EXCLUDE) if use_upx else []
+    # Older PyInstaller rejects the keyword, so only emit it when supported.
+    optimize_line = (
+        "optimize=2,  # Strip asserts and docstrings from bundled bytecode"
+        if supports_optimize() else ""
+    )
+
+    spec_content = f"""# -*- mode: python ; coding: utf-8 -*-
+# PyInstaller spec file for Nimble Encounter Builder
+# Auto-generated with enhanced PySide6 support
+
+block_cipher = None
+
+a = Analysis(
+    ['{main_script_str}'],
+    pathex=['{project_root_str}'],
+    {pyside_binaries if pyside_binaries else "binaries=[],"}
+    datas=[
+        {NEWLINE.join('        ' + d for d in datas)}
+    ],
+    hiddenimports=[
+        # PySide6 modules
+        'PySide6',
+        'PySide6.QtCore',
+        'PySide6.QtGui',
+        'PySide6.QtWidgets',
+        'PySide6.QtUiTools',
+        'shiboken6',
+        # Application modules
+{NEWLINE.join(f"        '{name}'," for name in _app_modules(project_root))}
+    ],
+    hookspath=[],
+    hooksconfig={{}},
+    runtime_hooks=[],
+    excludes=[
+        'matplotlib',
+        'numpy',
+        'pandas',
+        'scipy',
+        'tkinter',
+        # Qt modules the app never imports
+        'PySide6.QtQml',
+        'PySide6.QtQuick',
+        'PySide6.QtQuickWidgets',
+        'PySide6.QtWebEngineCore',
+        'PySide6.QtWebEngineWidgets',
+        'PySide6.QtWebEngineQuick',
+        'PySide6.QtPdf',
+        'PySide6.QtPdfWidgets',
+        'PySide6.QtNetwork',
+        'PySide6.QtDesigner',
+        'PySide6.QtHelp',
+        'PySide6.QtDBus',
+        'PySide6.QtTest',
+        'PySide6.QtMultimedia',
+        'PySide6.QtMultimediaWidgets',
+        'PySide6.Qt3DCore',
+        'PySide6.Qt3DRender',
+        'PySide6.Qt3DInput',
+        'PySide6.Qt3DLogic',
+        'PySide6.Qt3DAnimation',
+        'PySide6.Qt3DExtras',
+        'PySide6.QtCharts',
+        'PySide6.QtDataVisualization',
+    ],
+    win_no_prefer_redirects=False,
+    win_private_assemblies=False,
+    {optimize_line}
+    cipher=block_cipher,
+    noarchive=False,
+)
+
+{QT_DROP_FILTER}
+pyz = PYZ(a.pure, a.zipped_data, cipher=block_cipher)
+
+exe = EXE(
+    pyz,
+    a.scripts,
+    a.binaries,
+    a.zipfiles,
+    a.datas,
+    [],
+    name='{app_name}',
+    debug=False,
+    bootloader_ignore_signals=False,
+    strip=False,
+    upx={str(use_upx)},  # Set NIMBLE_BUILD_UPX=1 to compress (slower build)
+    upx_exclude={upx_exclude!r},
+    runtime_tmpdir=None,
+    console={str(debug_console)},  # Set NIMBLE_BUILD_CONSOLE=1 for debug output
+    disable_windowed_traceback=False,
+    argv_emulation=False,
+    target_arch=None,
+    codesign_identity=None,
+    entitlements_file=None,
+    {icon_line}
+)
+"""
+
+    # Leave an identical spec untouched so its mtime doesn't invalidate
+    # PyInstaller's cached Analysis.
+    if spec_file.exists() and spec_file.read_text(encoding='utf-8') == spec_content:
+        print(f"Spec file unchanged: {spec_file}")
+        return spec_file, app_name
+
+    # Write spec file
+    with open(spec_file, 'w', encoding='utf-8') as f:
+        f.write(spec_content)
+
+    print(f"Created spec file: {spec_file}")
+    return spec_file, app_name
+
+
+def _pyinstaller_env(build_dir: Path):
+    """Environment for a PyInstaller run with a per-project config/cache folder.
+
+    PYINSTALLER_CONFIG_DIR points at build/.pyi-cache, which is kept between
+    runs so PyInstaller's binary cache stays warm for incremental builds, and
+    other projects' builds never write into it. Set
+    NIMBLE_BUILD_SHARED_CACHE=1 to use the user-wide cache instead.
+    """
+    env = os.environ.copy()
+    if not env_flag("NIMBLE_BUILD_SHARED_CACHE"):
+        env["PYINSTALLER_CONFIG_DIR"] = str(build_dir / ".pyi-cache")
+    return env
+
+
+def _run_filtered(cmd, cwd, env):
+    """Run PyInstaller, echoing only progress, warnings and errors.
+
+    Other lines are shown as a row of dots. On failure the last lines of
+    the full output are printed. Set NIMBLE_BUILD_VERBOSE=1 to see everything.
+    """
+    verbose = env_flag("NIMBLE_BUILD_VERBOSE")
+    recent = deque(maxlen=40)
+    dots = 0
+    proc = subprocess.Popen(
+        cmd,
+        cwd=cwd,
+        env=env,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        bufsize=1,
+    )
+    for line in proc.stdout:
+        recent.append(line)
+        if verbose or PROGRESS_PATTERN.search(line):
+            if dots:
+                sys.stdout.write("\n")
+                dots = 0
+            sys.stdout.write(line)
+        else:
+            dots += 1
+            if dots % 50 == 0:
+                sys.stdout.write(".")
+                sys.stdout.flush()
+    if dots:
+        sys.stdout.write("\n")
+    returncode = proc.wait()
+    if returncode != 0 and not verbose:
+        print("Last PyInstaller output:")
+        sys.stdout.writelines(recent)
+    return returncode
+
+
+def run_pyinstaller(args):
+    """Run PyInstaller with args plus the shared flags; return True on success."""
+    DIST_DIR.mkdir(parents=True, exist_ok=True)
+
+    cmd = [
+        sys.executable,  # Use the same Python interpreter
+        "-m",
+        "PyInstaller",
+        "--distpath",
+        str(DIST_DIR),
+        "--noconfirm",
+    ]
+    # Reuse PyInstaller's work cache between builds; set NIMBLE_BUILD_CLEAN=1
+    # (or delete the build/ folder) to force a full rebuild.
+    if env_flag("NIMBLE_BUILD_CLEAN"):
+        cmd.append("--clean")
+    cmd.extend(args)
+
+    print()
+    print("Building executable with PyInstaller...")
+    print("Command:", " ".join(cmd))
+    print()
+    print("This may take several minutes...")
+    print()
+
+    env = _pyinstaller_env(DIST_DIR)
+    try:
+        returncode = _run_filtered(cmd, PROJECT_ROOT, env)
+        if returncode != 0:
+            print(f"Build failed with error code: {returncode}")
+            return False
+        return True
+    except Exception as e:
+        print(f"Unexpected error: {e}")
+        return False
+
+
+def build_from_spec(spec_file):
+    """Build the executable from a generated spec file."""
+    return run_pyinstaller([str(spec_file)])
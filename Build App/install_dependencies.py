@@ -8,12 +8,60 @@ Usage:
     python install_dependencies.py
 """
 
+import os
+import re
 import subprocess
 import sys
+from importlib import metadata
+
+def _version_tuple(version):
+    """Numeric release parts of a version string, e.g. '6.7.2' -> (6, 7, 2)."""
+    return tuple(int(part) for part in re.findall(r"\d+", version.split("+")[0])[:4])
+
+def _installed_version(package_name):
+    """Return (version, satisfied) for a requirement like 'pefile==2023.2.7'.
+
+    Only the ==, >= and < operators used by this installer are understood.
+    """
+    name, specs = re.match(r"([\w.-]+)(.*)", package_name).groups()
+    try:
+        version = metadata.version(name)
+    except metadata.PackageNotFoundError:
+        return None, False
+    installed = _version_tuple(version)
+    for spec in specs.split(","):
+        match = re.match(r"\s*(==|>=|<)\s*([\w.]+)", spec)
+        if not match:
+            continue
+        op, wanted = match.group(1), _version_tuple(match.group(2))
+        if (op == "==" and installed != wanted) or \
+                (op == ">=" and installed < wanted) or \
+                (op == "<" and installed >= wanted):
+            return version, False
+    return version, True
 
 def install_package(package_name):
-    """Install a package using pip."""
+    """Install a package using pip, skipping it when already satisfied."""
+    force = os.environ.get("NIMBLE_FORCE_UPGRADE", "").strip() == "1"
+    version, satisfied = _installed_version(package_name)
+    if satisfied and not force:
+        print(f"  [OK, cached] {package_name} ({version}) already installed")
+        return True
+
     print(f"Installing {package_name}...")
+    if _pip_install([package_name]):
+        print(f"  [OK] {package_name} installed successfully")
+        return True
+    print(f"  [FAILED] Could not install {package_name}")
+    return False
+
+def _pip_install(packages):
+    """Run a single pip install for all packages; return True on success.
+
+    Requirements are version-ranged, so pip settles them without --upgrade;
+    set NIMBLE_FORCE_UPGRADE=1 to pull the newest matching releases.
+    """
+    upgrade = ["--upgrade"] if os.environ.get("NIMBLE_FORCE_UPGRADE", "").strip() == "1" else []
     try:
         # Use the current interpreter to avoid venv mismatches.
         subprocess.check_call([
@@ -21,42 +69,72 @@ def install_package(package_name):
             "-m",
             "pip",
             "install",
-            "--upgrade",
-            package_name
+            *upgrade,
+            *packages
         ])
-        print(f"  [OK] {package_name} installed successfully")
         return True
     except subprocess.CalledProcessError:
-        print(f"  [FAILED] Could not install {package_name}")
         return False
 
+def install_packages(packages):
+    """Install packages with one pip invocation; return the ones that failed.
+
+    Already-satisfied packages are skipped. If the batched install fails,
+    each package is retried on its own so the failing one can be reported.
+    """
+    force = os.environ.get("NIMBLE_FORCE_UPGRADE", "").strip() == "1"
+    pending = []
+    for package in packages:
+        version, satisfied = _installed_version(package)
+        if satisfied and not force:
+            print(f"  [OK, cached] {package} ({version}) already installed")
+        else:
+            pending.append(package)
+    if not pending:
+        return []
+
+    print(f"Installing {' '.join(pending)}...")
+    if _pip_install(pending):
+        for package in pending:
+            print(f"  [OK] {package} installed successfully")
+        return []
+
+    print()
+    print("Batched install failed; retrying packages one at a time...")
+    print()
+    failed = []
+    for package in pending:
+        if not install_package(package):
+            failed.append(package)
+        print()
+    return failed
+
 def main():
     print("=" * 70)
     print("Nimble Encounter Builder - Dependency Installer")
     print("=" * 70)
     print()
     print("This will install the following packages:")
-    print("  - PySide6 (GUI framework)")
+    print("  - pyside6-essentials (GUI framework, core Qt modules only)")
     print("  - pyinstaller (for building executables)")
+    print("  - pefile 2023.2.7 (keeps PyInstaller's Windows DLL scan fast)")
     print()
 
     input("Press Enter to continue, or Ctrl+C to cancel...")
     print()
 
     packages = [
-        "PySide6",
-        "pyinstaller",
+        "pyside6-essentials>=6.5,<7",
+        # 6.6+ is needed for optimize= in the generated spec.
+        "pyinstaller>=6.6,<7",
+        # Newer pefile releases make PyInstaller's binary dependency scan
+        # dramatically slower on large Qt installs.
+        "pefile==2023.2.7",
     ]
 
-    success_count = 0
-    failed = []
-
-    for package in packages:
-        if install_package(package):
-            success_count += 1
-        else:
-            failed.append(package)
-        print()
+    failed = install_packages(packages)
+    success_count = len(packages) - len(failed)
+    print()
 
     print("=" * 70)
     print("Installation Summary")
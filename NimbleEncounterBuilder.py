@@ -8,12 +8,17 @@ Bestiary tab is powered by tabs.bestiary_tab.BestiaryTabController.
 
 from __future__ import annotations
 
+import mmap
+import os
+import stat
 import sys
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
-from PySide6.QtCore import QFile, QIODevice, Qt
-from PySide6.QtGui import QColor, QPalette, QPixmap
+from PySide6.QtCore import QFile, QIODevice, QSaveFile, Qt, QTimer
+from PySide6.QtGui import QColor, QImage, QPalette, QPixmap
 from PySide6.QtWidgets import (
     QApplication,
     QBoxLayout,
@@ -22,6 +27,7 @@ from PySide6.QtWidgets import (
     QLabel,
     QLineEdit,
     QListWidget,
+    QPlainTextEdit,
     QPushButton,
     QSplashScreen,
     QTableWidget,
@@ -48,6 +54,18 @@ from tabs.hero_dialog import show_add_edit_hero_dialog
 from tabs.heroes_tab import HeroesTabController
 
 
+def _stat_once(path) -> Optional[os.stat_result]:
+    """Single stat() of ``path``; None if it doesn't exist."""
+    try:
+        return os.stat(path)
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+
+
+# Separator between a saved combat log's header line and its body.
+_LOG_SEP = b"=" * 60 + b"\n\n"
+
+
 class NimbleMainApp:
     """Load the UI, initialize core services, and attach tab controllers."""
 
@@ -56,6 +74,12 @@ class NimbleMainApp:
         "Nimble 3rd Party Creator License. Nimble © Nimble Co."
     )
 
+    # Applied once on the window; every banner shares the object name.
+    _BANNER_QSS = (
+        "QLabel#label_license_banner { color: #9aa0a6; font-size: 10px; "
+        "padding: 4px 8px; border-top: 1px solid #3a3a3a; }"
+    )
+
     def __init__(self, ui_path: Path):
         self.ui_path = ui_path
 
@@ -69,10 +93,17 @@ class NimbleMainApp:
         if self.window is None:
             raise RuntimeError(f"Failed to load UI from: {ui_path}")
 
+        # Index named widgets once so tab wiring doesn't walk the tree per lookup.
+        self._widgets: dict[str, QWidget] = {}
+        for widget in self.window.findChildren(QWidget):
+            name = widget.objectName()
+            if name:
+                self._widgets.setdefault(name, widget)
+
         # Set Combat tab as the default tab on startup
-        tab_widget = self.window.findChild(QTabWidget, "mainTabs")
+        tab_widget = self._widget(QTabWidget, "mainTabs")
         if tab_widget:
-            combat_tab_widget = self.window.findChild(QWidget, "tab_combat")
+            combat_tab_widget = self._widget(QWidget, "tab_combat")
             if combat_tab_widget:
                 tab_widget.setCurrentWidget(combat_tab_widget)
 
@@ -82,17 +113,36 @@ class NimbleMainApp:
         self.manager = CombatManager()
 
         # Optional log widget (Combat Extras tab)
-        self.combat_log: Optional[QTextEdit] = self.window.findChild(
-            QTextEdit, "combat_log_text"
-        )
+        self.combat_log: Optional[QPlainTextEdit] = self._widget(QPlainTextEdit, "combat_log_text")
+
+        # Log lines are queued and appended in batches so a burst of combat
+        # events costs one document layout instead of one per message.
+        self._pending_log: list[str] = []
+        self._log_flush_timer = QTimer(self.window)
+        self._log_flush_timer.setSingleShot(True)
+        self._log_flush_timer.setInterval(50)
+        self._log_flush_timer.timeout.connect(self._flush_log)
 
         # Wire logging
         self.manager.on_log = self._append_log
+        # Coalesce autosaves: at most one session write per 250 ms burst.
+        self.manager.schedule_autosave = lambda flush: QTimer.singleShot(250, flush)
 
         # Ensure config path is set before wiring tabs that read config values
         # (tab controllers read CONFIG during init for widths/paths)
         self._ensure_config_path()
 
+        # Parse the autosave on a worker thread while the tabs are wired;
+        # _load_last_session applies it on the GUI thread.
+        self._session_prefetch: dict[Path, Future] = {}
+        autosave_path = Path(config.CONFIG.autosave_path)
+        if autosave_path.is_file():
+            pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="session-prefetch")
+            self._session_prefetch[autosave_path] = pool.submit(
+                CombatManager.read_session, str(autosave_path)
+            )
+            pool.shutdown(wait=False)
+
         # Tab controllers
         self.bestiary = None
         self.combat = None
@@ -101,9 +151,23 @@ class NimbleMainApp:
         self.config = None
         # Avoid loading autosave multiple times if tabs refresh early.
         self._session_loaded = False
+        # Each tab init asks for a cross-tab refresh; run it once afterwards.
+        self._refresh_suspended = True
         self._init_bestiary_tab()
         self._init_combat_tab()
         self._init_heroes_tab()
+        self._refresh_suspended = False
+        self._refresh_all_tabs()
+        # Controllers with column widths to re-apply when the config changes.
+        self._controllers = [
+            c for c in (self.combat, self.bestiary, self.heroes, self.heroes_tab)
+            if c is not None
+        ]
+        # Spin boxes report every keystroke; apply a burst of changes once.
+        self._config_change_timer = QTimer(self.window)
+        self._config_change_timer.setSingleShot(True)
+        self._config_change_timer.setInterval(50)
+        self._config_change_timer.timeout.connect(self._apply_config_change)
         self._init_config_tab()
         self._init_help_tab()
         self._init_log_buttons()
@@ -117,29 +181,34 @@ class NimbleMainApp:
     # Tabs
     # ------------------------------------------------------------------#
 
+    def _widget(self, cls: type, name: str):
+        """Return the named child widget if it exists and is a ``cls``."""
+        widget = self._widgets.get(name)
+        return widget if isinstance(widget, cls) else None
+
     def _init_bestiary_tab(self) -> None:
         """Setup the Bestiary tab controller."""
-        lm = self.window.findChild(QListWidget, "list_monsters_bestiary")
-        sp = self.window.findChild(QTextEdit, "stat_block_preview_bestiary")
-        te = self.window.findChild(QTableWidget, "monsters_table_bestiary")
+        lm = self._widget(QListWidget, "list_monsters_bestiary")
+        sp = self._widget(QTextEdit, "stat_block_preview_bestiary")
+        te = self._widget(QTableWidget, "monsters_table_bestiary")
         if lm is None or sp is None or te is None:
             raise RuntimeError(
                 "Bestiary widgets not found (list_monsters_bestiary / "
                 "stat_block_preview_bestiary / monsters_table_bestiary)."
             )
         # Non-required widgets (filters/buttons) may be absent; pass through as Optional
-        en = self.window.findChild(QLineEdit, "lineEdit_monsterSearch_bestiary")
-        cb = self.window.findChild(QComboBox, "combo_biomeSearch_bestiary")
-        el = self.window.findChild(QLineEdit, "lineEdit_levelSearch_bestiary")
-        lg = self.window.findChild(QCheckBox, "checkbox_show_legendary_bestiary")
-        ba = self.window.findChild(QPushButton, "btn_add_monster_bestiary")
-        bd = self.window.findChild(QPushButton, "btn_del_monster_bestiary")
-        bc = self.window.findChild(QPushButton, "btn_clear_encounter_bestiary")
-        bs = self.window.findChild(QPushButton, "btn_save_encounter_bestiary")
-        bl = self.window.findChild(QPushButton, "btn_load_encounter_bestiary")
-        br = self.window.findChild(QPushButton, "btn_random_encounter_bestiary")
-        bsc = self.window.findChild(QPushButton, "btn_set_color_bestiary")
-        label_diff = self.window.findChild(QLabel, "label_encounter_diff_bestiary")
+        en = self._widget(QLineEdit, "lineEdit_monsterSearch_bestiary")
+        cb = self._widget(QComboBox, "combo_biomeSearch_bestiary")
+        el = self._widget(QLineEdit, "lineEdit_levelSearch_bestiary")
+        lg = self._widget(QCheckBox, "checkbox_show_legendary_bestiary")
+        ba = self._widget(QPushButton, "btn_add_monster_bestiary")
+        bd = self._widget(QPushButton, "btn_del_monster_bestiary")
+        bc = self._widget(QPushButton, "btn_clear_encounter_bestiary")
+        bs = self._widget(QPushButton, "btn_save_encounter_bestiary")
+        bl = self._widget(QPushButton, "btn_load_encounter_bestiary")
+        br = self._widget(QPushButton, "btn_random_encounter_bestiary")
+        bsc = self._widget(QPushButton, "btn_set_color_bestiary")
+        label_diff = self._widget(QLabel, "label_encounter_diff_bestiary")
 
         self.bestiary = BestiaryTabController(
             manager=self.manager,
@@ -164,18 +233,18 @@ class NimbleMainApp:
 
     def _init_combat_tab(self) -> None:
         """Setup the Combat tab controller (monsters table)."""
-        te = self.window.findChild(QTableWidget, "monsters_table_combat")
+        te = self._widget(QTableWidget, "monsters_table_combat")
         if te is None:
             # Combat tab not present in this UI layout.
             return
-        stat_preview = self.window.findChild(QTextEdit, "combatStatBlockPreview")
-        loot_text = self.window.findChild(QTextEdit, "loot_text")
-        btn_reset = self.window.findChild(QPushButton, "btn_reset_combat")
-        label_difficulty = self.window.findChild(QLabel, "label_encounter_diff")
-        btn_add = self.window.findChild(QPushButton, "btn_add_monster")
-        btn_delete = self.window.findChild(QPushButton, "btn_del_monster")
-        btn_clear = self.window.findChild(QPushButton, "btn_clear_encounter")
-        btn_set_color = self.window.findChild(QPushButton, "btn_set_color")
+        stat_preview = self._widget(QTextEdit, "combatStatBlockPreview")
+        loot_text = self._widget(QTextEdit, "loot_text")
+        btn_reset = self._widget(QPushButton, "btn_reset_combat")
+        label_difficulty = self._widget(QLabel, "label_encounter_diff")
+        btn_add = self._widget(QPushButton, "btn_add_monster")
+        btn_delete = self._widget(QPushButton, "btn_del_monster")
+        btn_clear = self._widget(QPushButton, "btn_clear_encounter")
+        btn_set_color = self._widget(QPushButton, "btn_set_color")
         self.combat = CombatTabController(
             manager=self.manager,
             table=te,
@@ -192,10 +261,10 @@ class NimbleMainApp:
 
     def _init_heroes_tab(self) -> None:
         """Setup the Heroes tab controller."""
-        te_combat = self.window.findChild(QTableWidget, "heroes_table_combat")
-        te_heroes_tab = self.window.findChild(QTableWidget, "heroes_table_heroesTab")
-        btn_import = self.window.findChild(QPushButton, "btn_import_party_heroesTab")
-        btn_export = self.window.findChild(QPushButton, "btn_export_party_heroesTab")
+        te_combat = self._widget(QTableWidget, "heroes_table_combat")
+        te_heroes_tab = self._widget(QTableWidget, "heroes_table_heroesTab")
+        btn_import = self._widget(QPushButton, "btn_import_party_heroesTab")
+        btn_export = self._widget(QPushButton, "btn_export_party_heroesTab")
         if te_combat is None and te_heroes_tab is None:
             # No heroes tables in this UI layout.
             return
@@ -214,11 +283,11 @@ class NimbleMainApp:
                     log_fn=self._append_log,
                 )
 
-        add_button = self.window.findChild(QPushButton, "btn_add_hero_heroesTab")
+        add_button = self._widget(QPushButton, "btn_add_hero_heroesTab")
         if add_button is not None:
             add_button.clicked.connect(self._on_add_hero_clicked)
 
-        del_button = self.window.findChild(QPushButton, "btn_del_hero_heroesTab")
+        del_button = self._widget(QPushButton, "btn_del_hero_heroesTab")
         if del_button is not None:
             del_button.clicked.connect(self._on_delete_hero_clicked)
 
@@ -227,14 +296,14 @@ class NimbleMainApp:
     def _init_config_tab(self) -> None:
         """Setup the Config tab controller."""
         # Find the config tab widget
-        config_widget = self.window.findChild(QWidget, "tab_config")
+        config_widget = self._widget(QWidget, "tab_config")
         if config_widget is None:
             # Config tab not present in this UI layout.
             return
 
         # Find Save/Load Config buttons (if they exist in the UI)
-        btn_save = self.window.findChild(QPushButton, "btn_save_config")
-        btn_load = self.window.findChild(QPushButton, "btn_load_config")
+        btn_save = self._widget(QPushButton, "btn_save_config")
+        btn_load = self._widget(QPushButton, "btn_load_config")
 
         # Initialize the config tab controller
         self.config = ConfigTabController(
@@ -247,19 +316,50 @@ class NimbleMainApp:
         )
 
     def _init_help_tab(self) -> None:
-        """Load the README.html file into the Help tab."""
-        help_text_widget = self.window.findChild(QTextEdit, "help_text")
-        if help_text_widget is None:
+        """Defer loading README.html until the Help tab is first shown."""
+        self._help_loaded = False
+        self._help_text = self._widget(QTextEdit, "help_text")
+        if self._help_text is None:
             # Help tab is optional in some UI layouts.
             return
 
+        tab_widget = self._widget(QTabWidget, "mainTabs")
+        help_tab = self._widget(QWidget, "tab_help")
+        if tab_widget is None or help_tab is None:
+            # No tab switching to hook; load right away.
+            self._load_help_content()
+            return
+
+        def _on_tab_changed(_index: int) -> None:
+            if not self._help_loaded and tab_widget.currentWidget() is help_tab:
+                self._load_help_content()
+
+        tab_widget.currentChanged.connect(_on_tab_changed)
+        _on_tab_changed(tab_widget.currentIndex())
+
+    def _load_help_content(self) -> None:
+        """Load the README.html file into the Help tab."""
+        self._help_loaded = True
+        help_text_widget = self._help_text
+
         # Load the README.html file
         readme_path = PROJECT_ROOT / "README.html"
         if readme_path.exists():
             try:
-                with open(readme_path, 'r', encoding='utf-8') as f:
-                    html_content = f.read()
-                help_text_widget.setHtml(html_content)
+                # Decode straight from a read-only mapping of the file, so no
+                # bytes copy of README.html is made on the Python side.
+                with open(readme_path, "rb") as readme_file:
+                    if os.fstat(readme_file.fileno()).st_size == 0:
+                        # mmap refuses empty files.
+                        content = ""
+                    else:
+                        with mmap.mmap(readme_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                            content = str(mapped, "utf-8-sig")
+                # No on-disk cache of the parsed document: Qt can only read a
+                # QTextDocument back from HTML or Markdown (ODF is write-only),
+                # so a cached toHtml() copy would be parsed exactly like
+                # README.html and is usually larger.
+                help_text_widget.setHtml(content)
             except Exception as exc:
                 help_text_widget.setPlainText(f"Error loading help file: {exc}")
         else:
@@ -275,8 +375,11 @@ class NimbleMainApp:
             "tab_vault_viewer",
             "tab_help",
         ]
+        stylesheet = self.window.styleSheet()
+        if self._BANNER_QSS not in stylesheet:
+            self.window.setStyleSheet(f"{stylesheet}\n{self._BANNER_QSS}" if stylesheet else self._BANNER_QSS)
         for name in tab_names:
-            tab = self.window.findChild(QWidget, name)
+            tab = self._widget(QWidget, name)
             if tab is None:
                 continue
             if tab.findChild(QLabel, "label_license_banner"):
@@ -286,24 +389,27 @@ class NimbleMainApp:
             banner.setObjectName("label_license_banner")
             banner.setAlignment(Qt.AlignmentFlag.AlignCenter)
             banner.setWordWrap(True)
-            banner.setStyleSheet(
-                "color: #9aa0a6; font-size: 10px; padding: 4px 8px; "
-                "border-top: 1px solid #3a3a3a;"
-            )
             if layout is not None and isinstance(layout, QBoxLayout):
                 layout.addWidget(banner)
             else:
                 banner_height = 36
 
                 def _position_banner(event=None, widget=tab, label=banner):
-                    bottom_widgets = [
-                        child
-                        for child in widget.findChildren(QWidget)
-                        if child is not label
-                        and child.geometry().top() > widget.height() * 0.6
-                    ]
-                    if bottom_widgets:
-                        top_edge = min(child.geometry().top() for child in bottom_widgets)
+                    label._reposition_pending = False
+                    # Children sit at fixed positions, so the lowest-widget edge
+                    # only changes with the tab height or the set of children.
+                    cache_key = (widget.height(), len(widget.children()))
+                    if getattr(label, "_cached_key", None) != cache_key:
+                        bottom_tops = [
+                            child.geometry().top()
+                            for child in widget.findChildren(QWidget)
+                            if child is not label
+                            and child.geometry().top() > widget.height() * 0.6
+                        ]
+                        label._cached_top_edge = min(bottom_tops) if bottom_tops else None
+                        label._cached_key = cache_key
+                    top_edge = label._cached_top_edge
+                    if top_edge is not None:
                         y_pos = max(0, top_edge - banner_height - 4)
                     else:
                         y_pos = max(0, widget.height() - banner_height)
@@ -312,10 +418,15 @@ class NimbleMainApp:
                 _position_banner()
                 original_resize = tab.resizeEvent
 
-                def _resize_event(event, handler=original_resize):
+                def _resize_event(
+                    event, handler=original_resize, label=banner, position=_position_banner
+                ):
                     if handler is not None:
                         handler(event)
-                    _position_banner(event)
+                    # Collapse a burst of resize events into one reposition.
+                    if not getattr(label, "_reposition_pending", False):
+                        label._reposition_pending = True
+                        QTimer.singleShot(0, position)
 
                 tab.resizeEvent = _resize_event
 
@@ -323,9 +434,9 @@ class NimbleMainApp:
         """Connect the Save Log and Load Log buttons."""
         from datetime import datetime
 
-        btn_save_log = self.window.findChild(QPushButton, "btn_save_log")
-        btn_load_log = self.window.findChild(QPushButton, "btn_load_log")
-        btn_clear_log = self.window.findChild(QPushButton, "btn_clear_log")
+        btn_save_log = self._widget(QPushButton, "btn_save_log")
+        btn_load_log = self._widget(QPushButton, "btn_load_log")
+        btn_clear_log = self._widget(QPushButton, "btn_clear_log")
 
         if btn_save_log:
             btn_save_log.clicked.connect(self._on_save_log)
@@ -342,9 +453,10 @@ class NimbleMainApp:
         if not self.combat_log:
             # Combat log widget is optional (depends on UI layout).
             return
+        # Queued lines belong to the log being saved, loaded over or cleared.
+        self._flush_log()
 
-        log_content = self.combat_log.toPlainText()
-        if not log_content.strip():
+        if not self._log_has_content():
             # Avoid creating empty log files.
             QMessageBox.information(
                 self.window,
@@ -373,7 +485,8 @@ class NimbleMainApp:
                 return
 
         # Generate filename with timestamp
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        now = datetime.now()
+        timestamp = now.strftime("%Y%m%d_%H%M%S")
         default_name = f"combat_log_{timestamp}.txt"
 
         path, _ = QFileDialog.getSaveFileName(
@@ -387,11 +500,13 @@ class NimbleMainApp:
             # User canceled the save dialog.
             return
 
+        log_content = self.combat_log.toPlainText()
         try:
-            with open(path, 'w', encoding='utf-8') as f:
-                f.write(f"Combat Log - Saved {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-                f.write("=" * 60 + "\n\n")
-                f.write(log_content)
+            self._write_log_file(
+                path,
+                f"Combat Log - Saved {now.strftime('%Y-%m-%d %H:%M:%S')}",
+                log_content,
+            )
             self._append_log(f"Combat log saved to {path}")
         except Exception as exc:
             self._append_log(f"Error saving combat log: {exc}")
@@ -401,6 +516,37 @@ class NimbleMainApp:
                 f"Could not save combat log:\n{exc}",
             )
 
+    def _log_has_content(self) -> bool:
+        """True if the combat log holds any non-whitespace text.
+
+        Walks the document's blocks and stops at the first non-blank one,
+        rather than copying the whole log out with toPlainText().
+        """
+        document = self.combat_log.document()
+        if document.isEmpty():
+            return False
+        block = document.begin()
+        while block.isValid():
+            if block.text().strip():
+                return True
+            block = block.next()
+        return False
+
+    @staticmethod
+    def _write_log_file(path, header: str, log_content: str) -> None:
+        """Write a header line, separator and the log body in one write call."""
+        payload = header.encode("utf-8") + b"\n" + _LOG_SEP + log_content.encode("utf-8")
+        # QSaveFile writes to a temporary file and renames it on commit, so
+        # an interrupted save never leaves a truncated log behind. Text mode
+        # keeps platform line endings in saved logs.
+        save_file = QSaveFile(str(path))
+        if not save_file.open(QIODevice.OpenModeFlag.WriteOnly | QIODevice.OpenModeFlag.Text):
+            raise OSError(save_file.errorString())
+        if save_file.write(payload) != len(payload) or not save_file.commit():
+            error = save_file.errorString()
+            save_file.cancelWriting()
+            raise OSError(error)
+
     def _on_load_log(self) -> None:
         """Load a combat log from a text file."""
         from PySide6.QtWidgets import QFileDialog, QMessageBox
@@ -408,6 +554,8 @@ class NimbleMainApp:
         if not self.combat_log:
             # Combat log widget is optional (depends on UI layout).
             return
+        # Queued lines belong to the log being saved, loaded over or cleared.
+        self._flush_log()
 
         # Use configured log folder (respects Obsidian vault if set)
         logs_dir = config.CONFIG.get_combat_log_folder()
@@ -432,7 +580,7 @@ class NimbleMainApp:
                 content = f.read()
 
             # Ask if they want to append or replace existing log content.
-            if self.combat_log.toPlainText().strip():
+            if self._log_has_content():
                 reply = QMessageBox.question(
                     self.window,
                     "Append or Replace?",
@@ -445,9 +593,9 @@ class NimbleMainApp:
                     return
                 elif reply == QMessageBox.StandardButton.Yes:
                     # Append
-                    self.combat_log.append("\n" + "=" * 60)
-                    self.combat_log.append(f"Loaded from {Path(path).name}\n")
-                    self.combat_log.append(content)
+                    self.combat_log.appendPlainText("\n" + "=" * 60)
+                    self.combat_log.appendPlainText(f"Loaded from {Path(path).name}\n")
+                    self.combat_log.appendPlainText(content)
                 else:
                     # Replace
                     self.combat_log.setPlainText(content)
@@ -471,8 +619,10 @@ class NimbleMainApp:
         if not self.combat_log:
             # Combat log widget is optional (depends on UI layout).
             return
+        # Queued lines belong to the log being saved, loaded over or cleared.
+        self._flush_log()
 
-        if not self.combat_log.toPlainText().strip():
+        if not self._log_has_content():
             # Nothing to clear.
             return  # Already empty
 
@@ -504,13 +654,20 @@ class NimbleMainApp:
 
         # Find the most recent log file
         try:
-            log_files = list(logs_dir.glob("combat_log_*.txt"))
-            if not log_files:
+            # Single pass over the directory; DirEntry caches its stat().
+            with os.scandir(logs_dir) as entries:
+                latest = max(
+                    (
+                        e for e in entries
+                        if e.name.startswith("combat_log_") and e.name.endswith(".txt")
+                        and e.is_file()
+                    ),
+                    key=lambda e: e.stat().st_mtime,
+                    default=None,
+                )
+            if latest is None:
                 return  # No log files found
-
-            # Sort by modification time, most recent first
-            log_files.sort(key=lambda p: p.stat().st_mtime, reverse=True)
-            latest_log = log_files[0]
+            latest_log = Path(latest.path)
 
             # Prompt user
             reply = QMessageBox.question(
@@ -523,6 +680,8 @@ class NimbleMainApp:
             if reply == QMessageBox.StandardButton.Yes:
                 with open(latest_log, 'r', encoding='utf-8') as f:
                     content = f.read()
+                # Startup messages queued so far are replaced along with the rest.
+                self._flush_log()
                 self.combat_log.setPlainText(content)
                 self._append_log(f"Loaded log from {latest_log.name}")
         except Exception as exc:
@@ -530,15 +689,13 @@ class NimbleMainApp:
             pass
 
     def _on_config_changed(self) -> None:
-        """Called when config changes to refresh all table column widths."""
-        if self.combat is not None:
-            self.combat._apply_column_widths()
-        if self.bestiary is not None:
-            self.bestiary._apply_column_widths()
-        if self.heroes is not None:
-            self.heroes._apply_column_widths()
-        if self.heroes_tab is not None:
-            self.heroes_tab._apply_column_widths()
+        """Called when config changes; (re)starts the debounce timer."""
+        self._config_change_timer.start()
+
+    def _apply_config_change(self) -> None:
+        """Refresh all table column widths and tabs after a config change."""
+        for controller in self._controllers:
+            controller._apply_column_widths()
         self._refresh_all_tabs()
 
     def _on_vault_scanned(self, vault_path: Path) -> None:
@@ -547,34 +704,16 @@ class NimbleMainApp:
             # Bestiary tab isn't available in this UI layout.
             return
 
-        # Export the scanned data to a temporary JSON file so the existing
-        # loader codepath can parse it without a new interface.
         vault_viewer = self.config.vault_viewer if self.config else None
         if vault_viewer and vault_viewer.last_data:
-            import json
-            import tempfile
-            import os
+            # The scan result is already a parsed dict; hand it straight over.
+            self.manager.load_monster_library_from_dict(vault_viewer.last_data)
+            self._append_log(f"Monster library reloaded from scanned vault: {len(self.manager.monster_library)} templates")
 
-            # Create a temporary file to hold the bestiary JSON.
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False, encoding='utf-8') as tmp:
-                json.dump(vault_viewer.last_data, tmp, indent=2)
-                tmp_path = tmp.name
-
-            try:
-                # Load the monster library from the temporary JSON.
-                self.manager.load_monster_library(tmp_path)
-                self._append_log(f"Monster library reloaded from scanned vault: {len(self.manager.monster_library)} templates")
-
-                # Refresh bestiary filters and lists to reflect new data.
-                if self.bestiary:
-                    self.bestiary.populate_biome_filter()
-                    self.bestiary.apply_filters()
-            finally:
-                # Clean up temp file even if loading failed.
-                try:
-                    os.unlink(tmp_path)
-                except Exception:
-                    pass
+            # Refresh bestiary filters and lists to reflect new data.
+            if self.bestiary:
+                self.bestiary.populate_biome_filter()
+                self.bestiary.apply_filters()
 
     def _on_add_hero_clicked(self) -> None:
         """Prompt to create a new hero and add it to the manager."""
@@ -625,6 +764,10 @@ class NimbleMainApp:
 
     def _refresh_all_tabs(self) -> None:
         """Refresh all tabs that are present and hook manager callback."""
+        if self._refresh_suspended:
+            # Tabs are still being wired; __init__ refreshes once at the end.
+            return
+
         # Load last session BEFORE performing any mutations that autosave
         if not self._session_loaded:
             # Avoid re-loading autosave after UI mutations that can trigger autosave.
@@ -662,15 +805,49 @@ class NimbleMainApp:
             if handler is not None:
                 self.manager.on_concentration_note = handler
 
-    def _on_state_changed(self) -> None:
-        if self.bestiary is not None:
-            self.bestiary.on_state_changed()
-        if self.combat is not None:
-            self.combat.refresh_table()
-        if self.heroes is not None:
-            self.heroes.refresh_table()
-        if self.heroes_tab is not None:
-            self.heroes_tab.refresh_table()
+    def _on_state_changed(self, kind: Optional[str] = None) -> None:
+        # Only rebuild the tables a change can affect; None means anything.
+        heroes_changed = kind != CombatManager.CHANGE_MONSTERS
+        monsters_changed = kind != CombatManager.CHANGE_HEROES
+
+        # Hold repaints until every table is rebuilt so each state change
+        # paints once. Signals stay live: the combat tab relies on
+        # itemSelectionChanged to refresh its stat preview after selectRow.
+        candidates = []
+        if monsters_changed:
+            candidates += [
+                self.bestiary.table_encounter if self.bestiary is not None else None,
+                self.combat.table if self.combat is not None else None,
+            ]
+        if heroes_changed:
+            candidates += [
+                self.heroes.table if self.heroes is not None else None,
+                self.heroes_tab.table if self.heroes_tab is not None else None,
+            ]
+        tables = [table for table in candidates if table is not None]
+        for table in tables:
+            table.setUpdatesEnabled(False)
+        try:
+            if monsters_changed:
+                if self.bestiary is not None:
+                    self.bestiary.on_state_changed()
+                if self.combat is not None:
+                    self.combat.refresh_table()
+            else:
+                # Difficulty is monster levels over hero levels.
+                if self.bestiary is not None:
+                    self.bestiary._update_difficulty_label()
+                if self.combat is not None:
+                    self.combat._update_difficulty_label()
+            if heroes_changed:
+                if self.heroes is not None:
+                    self.heroes.refresh_table()
+                if self.heroes_tab is not None:
+                    self.heroes_tab.refresh_table()
+        finally:
+            for table in tables:
+                table.setUpdatesEnabled(True)
+                table.viewport().update()
 
     # ------------------------------------------------------------------#
     # Window Events
@@ -680,30 +857,38 @@ class NimbleMainApp:
         """Handle window close event - auto-save combat log."""
         from datetime import datetime
 
+        # Write any session change still waiting on the autosave timer.
+        try:
+            self.manager.flush_autosave()
+        except Exception as exc:
+            print(f"Error autosaving session: {exc}")
+
         # Auto-save the combat log if it has content
-        if self.combat_log and self.combat_log.toPlainText().strip():
-            try:
-                # Use configured log folder or fall back to PROJECT_ROOT/Combat Logs
-                if config.CONFIG.default_combat_log_folder:
-                    logs_dir = Path(config.CONFIG.default_combat_log_folder)
-                else:
-                    logs_dir = PROJECT_ROOT / "Combat Logs"
+        if self.combat_log:
+            self._flush_log()
+        if self.combat_log and self._log_has_content():
+            # Use configured log folder or fall back to PROJECT_ROOT/Combat Logs
+            if config.CONFIG.default_combat_log_folder:
+                logs_dir = Path(config.CONFIG.default_combat_log_folder)
+            else:
+                logs_dir = PROJECT_ROOT / "Combat Logs"
 
-                # Create folder if it doesn't exist
-                if not logs_dir.exists():
-                    logs_dir.mkdir(parents=True, exist_ok=True)
+            # Generate filename with timestamp
+            now = datetime.now()
+            timestamp = now.strftime("%Y%m%d_%H%M%S")
+            filename = f"combat_log_{timestamp}.txt"
+            filepath = logs_dir / filename
 
-                # Generate filename with timestamp
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                filename = f"combat_log_{timestamp}.txt"
-                filepath = logs_dir / filename
+            try:
+                # Create folder if it doesn't exist
+                logs_dir.mkdir(parents=True, exist_ok=True)
 
-                # Save the log
-                log_content = self.combat_log.toPlainText()
-                with open(filepath, 'w', encoding='utf-8') as f:
-                    f.write(f"Combat Log - Auto-saved on close {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-                    f.write("=" * 60 + "\n\n")
-                    f.write(log_content)
+                # Save the log; QSaveFile makes the write atomic.
+                self._write_log_file(
+                    filepath,
+                    f"Combat Log - Auto-saved on close {now.strftime('%Y-%m-%d %H:%M:%S')}",
+                    self.combat_log.toPlainText(),
+                )
 
                 print(f"Combat log auto-saved to {filepath}")
             except Exception as exc:
@@ -725,7 +910,9 @@ class NimbleMainApp:
 
         def _try_load(path: Path) -> bool:
             try:
-                self.manager.load_session(str(path))
+                prefetched = self._session_prefetch.pop(path, None)
+                session = prefetched.result() if prefetched is not None else None
+                self.manager.load_session(str(path), session=session)
                 return True
             except Exception as exc:  # noqa: BLE001
                 self._append_log(f"Could not load last session from {path}: {exc}")
@@ -760,7 +947,8 @@ class NimbleMainApp:
         from PySide6.QtWidgets import QFileDialog, QMessageBox
 
         current_path = config.get_config_path()
-        if current_path and current_path.is_file():
+        current_stat = _stat_once(current_path) if current_path else None
+        if current_stat is not None and stat.S_ISREG(current_stat.st_mode):
             # Load existing config and skip the prompt.
             config.load_config(current_path)
             return
@@ -777,25 +965,32 @@ class NimbleMainApp:
         btn_skip = box.addButton("Skip for Now", QMessageBox.ButtonRole.RejectRole)
         box.exec()
 
+        # Start the (native) dialogs where the user last looked, or next to a
+        # stale pointer, rather than enumerating the project folder each time.
+        start_dir = config.get_last_config_dir() or (
+            current_path.parent if current_path else config.PROJECT_ROOT
+        )
+
         clicked = box.clickedButton()
         if clicked == btn_open:
             # Use an existing config file (typically in a vault).
             path, _ = QFileDialog.getOpenFileName(
                 self.window,
                 "Select Config File",
-                str(config.PROJECT_ROOT),
+                str(start_dir),
                 "JSON Files (*.json);;All Files (*)",
             )
             if not path:
                 return
             config.set_config_path(path)
-            if not config.CONFIG_POINTER_FILE.exists():
+            if _stat_once(config.CONFIG_POINTER_FILE) is None:
                 QMessageBox.warning(
                     self.window,
                     "Config Pointer Not Written",
                     f"Could not write config_location.json to:\n{config.CONFIG_POINTER_FILE}\n"
                     "The app may prompt again on next launch.",
                 )
+            config.set_last_config_dir(Path(path).parent)
             config.load_config(path)
             return
 
@@ -804,13 +999,14 @@ class NimbleMainApp:
             path, _ = QFileDialog.getSaveFileName(
                 self.window,
                 "Create Config File",
-                str(config.PROJECT_ROOT / "config.json"),
+                str(start_dir / "config.json"),
                 "JSON Files (*.json);;All Files (*)",
             )
             if not path:
                 return
+            config.set_last_config_dir(Path(path).parent)
             config.set_config_path(path)
-            if not config.CONFIG_POINTER_FILE.exists():
+            if _stat_once(config.CONFIG_POINTER_FILE) is None:
                 QMessageBox.warning(
                     self.window,
                     "Config Pointer Not Written",
@@ -825,10 +1021,11 @@ class NimbleMainApp:
             base_dir = QFileDialog.getExistingDirectory(
                 self.window,
                 "Select Data Folder Base",
-                str(config.PROJECT_ROOT),
+                str(start_dir),
             )
             if not base_dir:
                 return
+            config.set_last_config_dir(base_dir)
 
             base = Path(base_dir) / "data"
             config.CONFIG.obsidian_vault_path = str(base)
@@ -836,68 +1033,115 @@ class NimbleMainApp:
             config.CONFIG.default_party_folder = "Heroes"
             config.CONFIG.default_combat_log_folder = "Combat Logs"
 
-            # Pre-create standard folders to avoid prompts later.
-            for folder in (
-                base / config.CONFIG.default_encounter_folder,
-                base / config.CONFIG.default_party_folder,
-                base / config.CONFIG.default_combat_log_folder,
-            ):
-                try:
-                    folder.mkdir(parents=True, exist_ok=True)
-                except Exception:
-                    pass
+            # Pre-create standard folders to avoid prompts later. The base is
+            # created once; its children then need no parent walk each.
+            try:
+                base.mkdir(parents=True, exist_ok=True)
+                for name in (
+                    config.CONFIG.default_encounter_folder,
+                    config.CONFIG.default_party_folder,
+                    config.CONFIG.default_combat_log_folder,
+                ):
+                    (base / name).mkdir(exist_ok=True)
+            except Exception:
+                pass
+            config.invalidate_exists_cache()
 
     def _append_log(self, message: str) -> None:
         if self.combat_log is not None:
-            self.combat_log.append(message)
+            self._pending_log.append(message)
+            if not self._log_flush_timer.isActive():
+                self._log_flush_timer.start()
         else:
             print(message)
 
+    def _flush_log(self) -> None:
+        """Append queued log lines to the combat log in one call."""
+        self._log_flush_timer.stop()
+        if self._pending_log and self.combat_log is not None:
+            self.combat_log.appendPlainText("\n".join(self._pending_log))
+            self._pending_log.clear()
+
+
+_DARK_PALETTE_COLORS = (
+    (QPalette.ColorRole.Window, QColor(30, 30, 30)),
+    (QPalette.ColorRole.WindowText, QColor(220, 220, 220)),
+    (QPalette.ColorRole.Base, QColor(20, 20, 20)),
+    (QPalette.ColorRole.AlternateBase, QColor(35, 35, 35)),
+    (QPalette.ColorRole.ToolTipBase, QColor(30, 30, 30)),
+    (QPalette.ColorRole.ToolTipText, QColor(220, 220, 220)),
+    (QPalette.ColorRole.Text, QColor(220, 220, 220)),
+    (QPalette.ColorRole.Button, QColor(45, 45, 45)),
+    (QPalette.ColorRole.ButtonText, QColor(220, 220, 220)),
+    (QPalette.ColorRole.BrightText, QColor(255, 0, 0)),
+    (QPalette.ColorRole.Highlight, QColor(90, 110, 180)),
+    (QPalette.ColorRole.HighlightedText, QColor(255, 255, 255)),
+    (QPalette.ColorRole.PlaceholderText, QColor(150, 150, 150)),
+)
 
-def main() -> int:
-    # Optional snapshot on launch for quick backups (skip when frozen in exe).
-    if not getattr(sys, "frozen", False):
+
+@lru_cache(maxsize=1)
+def _build_dark_palette() -> QPalette:
+    """Dark application palette, built once per process."""
+    palette = QPalette()
+    for role, color in _DARK_PALETTE_COLORS:
+        palette.setColor(role, color)
+    return palette
+
+
+@lru_cache(maxsize=1)
+def _splash_image(path: str, mtime_ns: int) -> QImage:
+    """
+    Splash artwork decoded and scaled to half size, cached per file
+    version. Kept as a QImage since a QPixmap must not outlive the app.
+    """
+    image = QImage(path)
+    if image.isNull():
+        return image
+    return image.scaled(
+        max(1, image.width() // 2),
+        max(1, image.height() // 2),
+        Qt.AspectRatioMode.KeepAspectRatio,
+        Qt.TransformationMode.SmoothTransformation,
+    )
+
+
+def _snapshot_in_background() -> None:
+    """Optional snapshot on launch for quick backups, off the UI thread."""
+    def _snapshot():
         try:
             snap_path = make_snapshot.make_snapshot()
             print(f"[snapshot] Created {snap_path}")
         except Exception as exc:  # noqa: BLE001
             print(f"[snapshot] Skipped ({exc})")
 
+    # Not a daemon thread: an early exit still waits for a complete zip.
+    pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="snapshot")
+    pool.submit(_snapshot)
+    pool.shutdown(wait=False)
+
+
+def main() -> int:
     app = QApplication(sys.argv)
     app.setStyle("Fusion")
-    palette = QPalette()
-    palette.setColor(QPalette.ColorRole.Window, QColor(30, 30, 30))
-    palette.setColor(QPalette.ColorRole.WindowText, QColor(220, 220, 220))
-    palette.setColor(QPalette.ColorRole.Base, QColor(20, 20, 20))
-    palette.setColor(QPalette.ColorRole.AlternateBase, QColor(35, 35, 35))
-    palette.setColor(QPalette.ColorRole.ToolTipBase, QColor(30, 30, 30))
-    palette.setColor(QPalette.ColorRole.ToolTipText, QColor(220, 220, 220))
-    palette.setColor(QPalette.ColorRole.Text, QColor(220, 220, 220))
-    palette.setColor(QPalette.ColorRole.Button, QColor(45, 45, 45))
-    palette.setColor(QPalette.ColorRole.ButtonText, QColor(220, 220, 220))
-    palette.setColor(QPalette.ColorRole.BrightText, QColor(255, 0, 0))
-    palette.setColor(QPalette.ColorRole.Highlight, QColor(90, 110, 180))
-    palette.setColor(QPalette.ColorRole.HighlightedText, QColor(255, 255, 255))
-    palette.setColor(QPalette.ColorRole.PlaceholderText, QColor(150, 150, 150))
-    app.setPalette(palette)
+    app.setPalette(_build_dark_palette())
     here = Path(__file__).resolve().parent
     ui_path = here / "uiDesign" / "nimbleHandy.ui"
 
     splash = None
     splash_path = PROJECT_ROOT / "EncounterBuilderAppImage.png"
-    if splash_path.exists():
-        pixmap = QPixmap(str(splash_path))
-        if not pixmap.isNull():
-            scaled = pixmap.scaled(
-                max(1, pixmap.width() // 2),
-                max(1, pixmap.height() // 2),
-                Qt.AspectRatioMode.KeepAspectRatio,
-                Qt.TransformationMode.SmoothTransformation,
-            )
-            splash = QSplashScreen(scaled)
+    splash_stat = _stat_once(splash_path)
+    if splash_stat is not None:
+        image = _splash_image(str(splash_path), splash_stat.st_mtime_ns)
+        if not image.isNull():
+            splash = QSplashScreen(QPixmap.fromImage(image))
             splash.show()
             app.processEvents()
 
+    # Skip the snapshot when frozen in an exe.
+    if not getattr(sys, "frozen", False):
+        _snapshot_in_background()
+
     nimble = NimbleMainApp(ui_path)
     nimble.window.move(0, 0)  # Position at top-left of screen
     nimble.window.show()
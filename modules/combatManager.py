@@ -54,7 +54,13 @@
 #
 #   Autosave:
 #       • Controlled by CONFIG.autosave_enabled and CONFIG.autosave_path.
-#       • Called after every state mutation.
+#       • Every state mutation marks the session dirty. If the UI installs
+#         a schedule_autosave hook, writes are coalesced through it;
+#         otherwise the session is written immediately.
+#       • flush_autosave() writes any pending change (e.g. on exit).
+#       • Writes append only the changed rows to a delta log; a full
+#         snapshot is written first, after adds/removes, and every
+#         AUTOSAVE_SNAPSHOT_EVERY deltas.
 #
 #   Logging:
 #       • Controlled by CONFIG.log_* flags.
@@ -67,7 +73,7 @@
 from __future__ import annotations
 
 from fractions import Fraction
-from typing import List, Optional, Callable, Dict
+from typing import List, Optional, Callable, Dict, Iterable, Tuple
 
 from modules.combatants import (
     Hero,
@@ -80,6 +86,9 @@ from modules.combatants import (
 from modules import persistence
 from modules import config
 
+# Parsed string levels ("1/2", "3", ...); a library only has a handful.
+_LEVEL_CACHE: Dict[str, float] = {}
+
 
 class CombatManager:
     """
@@ -88,6 +97,13 @@ class CombatManager:
     persistence or config directly.
     """
 
+    # Change kinds passed to on_state_changed; None means "anything".
+    CHANGE_HEROES = "heroes"
+    CHANGE_MONSTERS = "monsters"
+
+    # Deltas appended to the autosave log before the next full snapshot.
+    AUTOSAVE_SNAPSHOT_EVERY = 50
+
     # --------------------------------------------------------------------
     # 1. Constructor / event hooks
     # --------------------------------------------------------------------
@@ -95,18 +111,34 @@ class CombatManager:
     def __init__(self):
         self.heroes: List[Hero] = []
         self.monsters: List[MonsterInstance] = []
-        self.monster_library: List[MonsterTemplate] = []
+        # template.file -> template, rebuilt by the monster_library setter
+        self._library_by_file: Dict[str, MonsterTemplate] = {}
+        self.monster_library = []
 
         # Map marker management
         self.group_color_map: Dict[str, str] = {}   # group string -> hex color
+        # color -> highest marker_number in use; None means rebuild on demand
+        self._marker_max_by_color: Optional[Dict[str, int]] = None
 
         # Optional callbacks for UI
         self.on_log: Optional[Callable[[str], None]] = None
-        self.on_state_changed: Optional[Callable[[], None]] = None
+        self.on_state_changed: Optional[Callable[[Optional[str]], None]] = None
         self.on_concentration_note: Optional[Callable[[Hero | MonsterInstance], None]] = None
 
-        # Marker palette is driven by configuration
-        self._marker_palette: List[str] = list(config.CONFIG.marker_palette)
+        # Optional deferral hook: called with a callback to run shortly,
+        # letting the UI coalesce bursts of mutations into one autosave.
+        self.schedule_autosave: Optional[Callable[[Callable[[], None]], None]] = None
+        self._dirty = False
+        self._autosave_scheduled = False
+        # Rows as last written to the autosave; None forces a full snapshot.
+        self._saved_rows: Optional[Dict[str, List[dict]]] = None
+        self._saved_path: Optional[str] = None
+        self._saved_generation = ""
+        self._deltas_since_snapshot = 0
+
+        # Marker palette is driven by configuration; snapshot it read-only
+        self._marker_palette: Tuple[str, ...] = tuple(config.CONFIG.marker_palette)
+        self._palette_len = len(self._marker_palette)
 
     # --------------------------------------------------------------------
     # Internal helpers
@@ -116,11 +148,19 @@ class CombatManager:
         if self.on_log:
             self.on_log(msg)
 
-    def _changed(self):
-        # Autosave every mutation if enabled
-        self.autosave()
+    def _changed(self, kind: Optional[str] = None, markers_unchanged: bool = False):
+        # Callers outside this class may have renumbered or dropped monsters.
+        if not markers_unchanged and kind != self.CHANGE_HEROES:
+            self._marker_max_by_color = None
+        # Autosave every mutation if enabled, coalesced when the UI allows
+        self._dirty = True
+        if self.schedule_autosave is None:
+            self.flush_autosave()
+        elif not self._autosave_scheduled:
+            self._autosave_scheduled = True
+            self.schedule_autosave(self.flush_autosave)
         if self.on_state_changed:
-            self.on_state_changed()
+            self.on_state_changed(kind)
 
     def _notify_concentration_note(self, creature) -> None:
         """Trigger the external concentration notification hook, if one is registered."""
@@ -144,26 +184,35 @@ class CombatManager:
         if key in self.group_color_map:
             return self.group_color_map[key]
 
-        if not self._marker_palette:
+        if not self._palette_len:
             color = "#FFFFFF"
         else:
-            idx = len(self.group_color_map) % len(self._marker_palette)
+            idx = len(self.group_color_map) % self._palette_len
             color = self._marker_palette[idx]
 
         self.group_color_map[key] = color
         return color
 
+    def _marker_counters(self) -> Dict[str, int]:
+        """
+        Highest marker_number per marker_color among current monsters,
+        rebuilt with one scan after anything may have changed markers.
+        """
+        if self._marker_max_by_color is None:
+            counters: Dict[str, int] = {}
+            for m in self.monsters:
+                if m.marker_number > counters.get(m.marker_color, 0):
+                    counters[m.marker_color] = m.marker_number
+            self._marker_max_by_color = counters
+        return self._marker_max_by_color
+
     def _next_marker_number_for_color(self, color: str) -> int:
         """
-        Compute the next marker_number for the given color by scanning
-        existing monsters with that exact marker_color.
+        Compute the next marker_number for the given color from the
+        highest number already used by monsters with that marker_color.
         """
         start = config.CONFIG.marker_start_number
-        max_found = 0
-
-        for m in self.monsters:
-            if m.marker_color == color and m.marker_number > max_found:
-                max_found = m.marker_number
+        max_found = self._marker_counters().get(color, 0)
 
         if max_found <= 0:
             return start
@@ -192,10 +241,12 @@ class CombatManager:
             monster.marker_color = color
 
         # Number per color
-        if monster.marker_number and monster.marker_number > 0:
-            return
+        if not (monster.marker_number and monster.marker_number > 0):
+            monster.marker_number = self._next_marker_number_for_color(color)
 
-        monster.marker_number = self._next_marker_number_for_color(color)
+        counters = self._marker_counters()
+        if monster.marker_number > counters.get(color, 0):
+            counters[color] = monster.marker_number
 
     def _rebuild_marker_maps(self) -> None:
         """
@@ -206,35 +257,54 @@ class CombatManager:
         continues from current monsters.
         """
         self.group_color_map = {}
+        self._marker_max_by_color = None
 
-        # First pass: respect existing group/color combos
+        # Single pass: respect existing group/color combos and set aside
+        # monsters with no color yet. Those are colored only after every
+        # existing combo is known, since a colored monster later in the
+        # list still decides its group's color.
+        uncolored: List[MonsterInstance] = []
         for m in self.monsters:
-            group = m.group or ""
-            color = m.marker_color or ""
-            if group not in self.group_color_map and color:
-                self.group_color_map[group] = color
+            if m.marker_color:
+                self.group_color_map.setdefault(m.group or "", m.marker_color)
+            else:
+                uncolored.append(m)
 
-        # Second pass: assign colors to monsters with no color yet
-        for m in self.monsters:
-            if not m.marker_color:
-                group = m.group or ""
-                color = self._get_or_assign_group_color(group)
-                m.marker_color = color
+        for m in uncolored:
+            m.marker_color = self._get_or_assign_group_color(m.group or "")
 
     # ====================================================================
     # 2. Monster Library
     # ====================================================================
 
     def load_monster_library(self, path: str):
-        self.monster_library = persistence.load_monster_library(path)
+        self._set_monster_library(persistence.load_monster_library(path))
+
+    def load_monster_library_from_dict(self, data):
+        """
+        Load the monster library from already-parsed data (e.g. a vault
+        scan) without a round-trip through a JSON file.
+        """
+        self._set_monster_library(persistence.monster_library_from_data(data))
+
+    @property
+    def monster_library(self) -> List[MonsterTemplate]:
+        return self._monster_library
+
+    @monster_library.setter
+    def monster_library(self, templates: List[MonsterTemplate]):
+        # Assign whole lists: in-place edits would bypass the file index.
+        self._monster_library = templates
+        # Index by file; the first template wins, as the old linear scan did.
+        self._library_by_file = {tpl.file: tpl for tpl in reversed(templates)}
+
+    def _set_monster_library(self, templates: List[MonsterTemplate]):
+        self.monster_library = templates
         self._log(f"Loaded {len(self.monster_library)} monsters from library.")
         self._changed()
 
     def find_template_by_file(self, template_file: str) -> Optional[MonsterTemplate]:
-        for tpl in self.monster_library:
-            if tpl.file == template_file:
-                return tpl
-        return None
+        return self._library_by_file.get(template_file)
 
     # ====================================================================
     # 3. Hero Management
@@ -243,18 +313,30 @@ class CombatManager:
     def add_hero(self, hero: Hero):
         self.heroes.append(hero)
         self._log(f"Hero added: {hero.name}")
-        self._changed()
+        self._changed(self.CHANGE_HEROES)
 
     def new_hero(self, name: str = "New Hero") -> Hero:
         hero = Hero.new(name)
         self.add_hero(hero)
         return hero
 
+    @staticmethod
+    def _pop_identical(items: list, obj) -> bool:
+        """
+        Remove ``obj`` itself from ``items``. Matching by identity skips
+        the field-by-field dataclass __eq__ and never removes a different
+        but equal entry.
+        """
+        for i, item in enumerate(items):
+            if item is obj:
+                del items[i]
+                return True
+        return False
+
     def remove_hero(self, hero: Hero):
-        if hero in self.heroes:
-            self.heroes.remove(hero)
+        if self._pop_identical(self.heroes, hero):
             self._log(f"Hero removed: {hero.name}")
-            self._changed()
+            self._changed(self.CHANGE_HEROES)
 
     # ====================================================================
     # 4. Monster Management
@@ -280,9 +362,40 @@ class CombatManager:
             f"Monster added: {m.name} "
             f"(group='{m.group}', color={m.marker_color}, #={m.marker_number})"
         )
-        self._changed()
+        self._changed(self.CHANGE_MONSTERS, markers_unchanged=True)
         return m
 
+    def add_monsters_from_templates(
+        self,
+        specs: Iterable[Tuple[MonsterTemplate | str, Optional[str]]],
+    ) -> List[MonsterInstance]:
+        """
+        Add several monsters at once from (template, group) pairs, with a
+        single log line, autosave and UI refresh at the end.
+
+        A template may be given by its file; unknown files are logged and
+        skipped.
+        """
+        added: List[MonsterInstance] = []
+        for template, group in specs:
+            if isinstance(template, str):
+                tpl = self._library_by_file.get(template)
+                if tpl is None:
+                    self._log(f"Monster template not found: {template}")
+                    continue
+                template = tpl
+            m = MonsterInstance.from_template(template)
+            if group is not None:
+                m.group = group
+            self._assign_marker_for_monster(m)
+            added.append(m)
+
+        if added:
+            self.monsters.extend(added)
+            self._log(f"Added {len(added)} monsters")
+            self._changed(self.CHANGE_MONSTERS, markers_unchanged=True)
+        return added
+
     def add_monster_instance(self, instance: MonsterInstance):
         """
         Add a pre-built MonsterInstance to the encounter, normalizing
@@ -294,14 +407,13 @@ class CombatManager:
             f"Monster added (instance): {instance.name} "
             f"(group='{instance.group}', color={instance.marker_color}, #={instance.marker_number})"
         )
-        self._changed()
+        self._changed(self.CHANGE_MONSTERS, markers_unchanged=True)
 
     def remove_monster(self, monster: MonsterInstance):
-        if monster in self.monsters:
-            self.monsters.remove(monster)
+        if self._pop_identical(self.monsters, monster):
             self._log(f"Monster removed: {monster.name}")
             # No renumbering
-            self._changed()
+            self._changed(self.CHANGE_MONSTERS)
 
     # ====================================================================
     # 5. Combat Actions
@@ -310,54 +422,70 @@ class CombatManager:
     # --- HEROES ---
 
     def damage_hero(self, hero: Hero, amount: int):
+        if amount <= 0:
+            return
+        cfg = config.CONFIG
         before = (hero.hp_current, hero.temp_hp)
         hero.apply_damage(amount)
         after = (hero.hp_current, hero.temp_hp)
 
-        if config.CONFIG.log_damage_events:
+        if cfg.log_damage_events:
             self._log(
                 f"Hero {hero.name} takes {amount} damage "
                 f"(HP {before[0]}→{after[0]}, Temp {before[1]}→{after[1]})"
             )
 
-        if hero.is_dying and config.CONFIG.log_deaths:
+        if cfg.log_deaths and hero.is_dying:
             self._log(f"⚠ Hero {hero.name} is DYING!")
 
         if getattr(hero, "concentrating", False):
             self._notify_concentration_note(hero)
 
-        self._changed()
+        self._changed(self.CHANGE_HEROES)
 
     def heal_hero(self, hero: Hero, amount: int):
         before = hero.hp_current
         hero.apply_healing(amount)
         after = hero.hp_current
+        if after == before:
+            return
 
         if config.CONFIG.log_heal_events:
             self._log(f"Hero {hero.name} heals {amount} HP ({before}→{after})")
-        self._changed()
+        self._changed(self.CHANGE_HEROES)
 
     def set_hero_temp_hp(self, hero: Hero, amount: int):
-        hero.set_temp_hp(amount)
+        if not hero.set_temp_hp(amount):
+            return
         if config.CONFIG.log_condition_changes:
             self._log(f"Hero {hero.name} gains {amount} temporary HP.")
-        self._changed()
+        self._changed(self.CHANGE_HEROES)
 
     def add_hero_condition(self, hero: Hero, cond: str):
-        hero.add_condition(cond)
+        if not hero.add_condition(cond):
+            return
         if config.CONFIG.log_condition_changes:
             self._log(f"Hero {hero.name} gains condition: {cond}")
-        self._changed()
+        self._changed(self.CHANGE_HEROES)
 
     def remove_hero_condition(self, hero: Hero, cond: str):
-        hero.remove_condition(cond)
+        if not hero.remove_condition(cond):
+            return
         if config.CONFIG.log_condition_changes:
             self._log(f"Hero {hero.name} loses condition: {cond}")
-        self._changed()
+        self._changed(self.CHANGE_HEROES)
 
     # --- MONSTERS ---
 
     def damage_monster(self, monster: MonsterInstance, amount: int):
+        if self._apply_monster_damage(monster, amount, config.CONFIG):
+            self._changed(self.CHANGE_MONSTERS, markers_unchanged=True)
+
+    def _apply_monster_damage(self, monster: MonsterInstance, amount: int, cfg) -> bool:
+        """Damage and log one monster; False when nothing could change."""
+        # Dead monsters and non-positive amounts are no-ops in the model.
+        if amount <= 0 or monster.dead:
+            return False
         before_hp = monster.hp_current
         before_temp = monster.temp_hp
 
@@ -366,48 +494,53 @@ class CombatManager:
         after_hp = monster.hp_current
         after_temp = monster.temp_hp
 
-        if config.CONFIG.log_damage_events:
+        if cfg.log_damage_events:
             self._log(
                 f"Monster {monster.name} takes {amount} damage "
                 f"(HP {before_hp}→{after_hp}, Temp {before_temp}→{after_temp})"
             )
 
-        if monster.is_last_stand and config.CONFIG.log_last_stand_triggers:
+        # Check the cheap config flags before the status properties.
+        if cfg.log_last_stand_triggers and monster.is_last_stand:
             self._log(
                 f"🔥 {monster.name} triggers LAST STAND ({monster.last_stand_hp_value} HP)!"
             )
 
-        if monster.is_dead and config.CONFIG.log_deaths:
+        if cfg.log_deaths and monster.is_dead:
             self._log(f"💀 Monster {monster.name} is DEAD.")
-
-        self._changed()
+        return True
 
     def heal_monster(self, monster: MonsterInstance, amount: int):
         before = monster.hp_current
         monster.apply_healing(amount)
         after = monster.hp_current
+        if after == before:
+            return
 
         if config.CONFIG.log_heal_events:
             self._log(f"Monster {monster.name} heals {amount} HP ({before}→{after})")
-        self._changed()
+        self._changed(self.CHANGE_MONSTERS, markers_unchanged=True)
 
     def set_monster_temp_hp(self, monster: MonsterInstance, amount: int):
-        monster.set_temp_hp(amount)
+        if not monster.set_temp_hp(amount):
+            return
         if config.CONFIG.log_condition_changes:
             self._log(f"Monster {monster.name} gains {amount} temporary HP.")
-        self._changed()
+        self._changed(self.CHANGE_MONSTERS, markers_unchanged=True)
 
     def add_monster_condition(self, monster: MonsterInstance, cond: str):
-        monster.add_condition(cond)
+        if not monster.add_condition(cond):
+            return
         if config.CONFIG.log_condition_changes:
             self._log(f"Monster {monster.name} gains condition: {cond}")
-        self._changed()
+        self._changed(self.CHANGE_MONSTERS, markers_unchanged=True)
 
     def remove_monster_condition(self, monster: MonsterInstance, cond: str):
-        monster.remove_condition(cond)
+        if not monster.remove_condition(cond):
+            return
         if config.CONFIG.log_condition_changes:
             self._log(f"Monster {monster.name} loses condition: {cond}")
-        self._changed()
+        self._changed(self.CHANGE_MONSTERS, markers_unchanged=True)
 
     # ====================================================================
     # 6. Party Load/Save
@@ -417,11 +550,12 @@ class CombatManager:
         party = persistence.load_party(path)
         self.heroes = party.heroes
         self._log(f"Loaded party: {party.name} ({len(self.heroes)} heroes)")
-        self._changed()
+        self._changed(self.CHANGE_HEROES)
 
     def save_party(self, path: str, name: Optional[str] = None):
         party = Party.new(name or "Party")
-        party.heroes = self.heroes.copy()
+        # The Party only lives for the synchronous save; no copy needed.
+        party.heroes = self.heroes
         persistence.save_party(path, party)
         self._log(f"Saved party: {party.name}")
 
@@ -434,11 +568,12 @@ class CombatManager:
         self.monsters = enc.monsters
         self._log(f"Loaded encounter: {enc.name} ({len(self.monsters)} monsters)")
         self._rebuild_marker_maps()
-        self._changed()
+        self._changed(self.CHANGE_MONSTERS)
 
     def save_encounter(self, path: str, name: Optional[str] = None):
         enc = Encounter.new(name or "Encounter")
-        enc.monsters = self.monsters.copy()
+        # The Encounter only lives for the synchronous save; no copy needed.
+        enc.monsters = self.monsters
         persistence.save_encounter(path, enc)
         self._log(f"Saved encounter: {enc.name}")
 
@@ -446,30 +581,96 @@ class CombatManager:
     # 8. Session Autosave
     # ====================================================================
 
+    def flush_autosave(self):
+        """
+        Write the session if anything changed since the last autosave.
+        """
+        self._autosave_scheduled = False
+        if not self._dirty:
+            return
+        self._dirty = False
+        self.autosave()
+
     def autosave(self):
         """
         Autosave current heroes/monsters if enabled in config.
         """
-        if not config.CONFIG.autosave_enabled:
+        cfg = config.CONFIG
+        if not cfg.autosave_enabled:
             return
-        persistence.autosave_session(
-            self.heroes,
-            self.monsters,
-            path=config.CONFIG.autosave_path,
-        )
+        path = cfg.autosave_path
+        rows = {
+            "heroes": [h.to_dict() for h in self.heroes],
+            "monsters": [m.to_dict() for m in self.monsters],
+        }
+        delta = self._session_delta(path, rows)
+        if delta is None:
+            self._saved_generation = persistence.autosave_session(
+                self.heroes,
+                self.monsters,
+                path=path,
+            )
+            self._saved_path = path
+            self._deltas_since_snapshot = 0
+        elif delta["heroes"] or delta["monsters"]:
+            persistence.append_session_delta(path, self._saved_generation, **delta)
+            self._deltas_since_snapshot += 1
+        self._saved_rows = rows
+
+    def _session_delta(
+        self, path: str, rows: Dict[str, List[dict]]
+    ) -> Optional[Dict[str, Dict[int, dict]]]:
+        """
+        Rows changed since the last autosave, by list index, or None when
+        a full snapshot is due (first write, new path, added/removed
+        creatures, or too many deltas already).
+        """
+        saved = self._saved_rows
+        if (
+            saved is None
+            or path != self._saved_path
+            or self._deltas_since_snapshot >= self.AUTOSAVE_SNAPSHOT_EVERY
+        ):
+            return None
+        delta: Dict[str, Dict[int, dict]] = {}
+        for key, current in rows.items():
+            previous = saved[key]
+            if len(previous) != len(current):
+                return None
+            delta[key] = {
+                i: row for i, (old, row) in enumerate(zip(previous, current)) if old != row
+            }
+        return delta
+
+    @staticmethod
+    def read_session(path: str) -> Tuple[List[Hero], List[MonsterInstance]]:
+        """
+        Parse a session file without touching manager state, so it can run
+        on a worker thread; pass the result to load_session(session=...).
+        """
+        return persistence.load_session(path)
 
-    def load_session(self, path: str | None = None):
+    def load_session(
+        self,
+        path: str | None = None,
+        session: Tuple[List[Hero], List[MonsterInstance]] | None = None,
+    ):
         """
-        Load a session from the configured autosave path by default.
+        Load a session from the configured autosave path by default, or
+        apply an already-parsed session from read_session().
         """
-        actual_path = path or config.CONFIG.autosave_path
-        heroes, monsters = persistence.load_session(actual_path)
+        if session is None:
+            actual_path = path or config.CONFIG.autosave_path
+            session = persistence.load_session(actual_path)
+        heroes, monsters = session
         self.heroes = heroes
         self.monsters = monsters
         self._log(
             f"Session loaded: {len(self.heroes)} heroes, {len(self.monsters)} monsters"
         )
         self._rebuild_marker_maps()
+        # The next autosave starts from a full snapshot of this state.
+        self._saved_rows = None
         # Notify UI of state change without triggering autosave
         if self.on_state_changed:
             self.on_state_changed()
@@ -480,21 +681,23 @@ class CombatManager:
 
     def total_hero_levels(self) -> int:
         """Calculate the sum of all hero levels."""
-        return sum(getattr(h, "level", 0) for h in self.heroes)
+        return sum(h.level for h in self.heroes)
 
     def total_monster_levels(self) -> int:
         """
         Calculate the sum of all non-dead monster levels.
         Includes both active and inactive monsters (only excludes dead monsters).
         """
+        # Hero/MonsterInstance always declare level and dead, so read them
+        # directly rather than through getattr defaults.
+        parse = self._parse_level_value
         total = 0.0
         for m in self.monsters:
-            if getattr(m, "dead", False):
+            if m.dead:
                 continue
             # Monster level might be stored as string or int
-            level = getattr(m, "level", 0)
             try:
-                total += self._parse_level_value(level)
+                total += parse(m.level)
             except (ValueError, TypeError):
                 continue
         return total
@@ -505,13 +708,19 @@ class CombatManager:
         if isinstance(level, (int, float)):
             return float(level)
         if isinstance(level, str):
+            cached = _LEVEL_CACHE.get(level)
+            if cached is not None:
+                return cached
             raw = level.strip()
             if not raw:
                 return 0.0
             token = raw.split()[0]
             if "/" in token:
-                return float(Fraction(token))
-            return float(token)
+                result = float(Fraction(token))
+            else:
+                result = float(token)
+            _LEVEL_CACHE[level] = result
+            return result
         return 0.0
 
     def encounter_difficulty_ratio(self) -> float:
@@ -81,17 +81,41 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field, asdict
+import re
+import sys
+from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import List, Dict, Any, Optional
 
 from modules import config
 
 
+# HP bands returned by hp_status; each names a CONFIG.hp_<band>_color.
+HP_DOWN = "down"
+HP_CRITICAL = "critical"
+HP_BLOODIED = "bloodied"
+HP_HEALTHY = "healthy"
+
+# First whitespace-separated token, when it is a whole integer.
+_LEADING_INT_RE = re.compile(r"\s*([+-]?\d+)(?!\S)")
+
+
+@lru_cache(maxsize=1024)
+def _leading_int(text: str) -> Optional[int]:
+    """
+    Parse forms like "24" or "24 HP" to 24; None if the first token is
+    not an integer. Libraries reuse a small set of HP strings, so this
+    is cached.
+    """
+    match = _LEADING_INT_RE.match(text)
+    return int(match.group(1)) if match else None
+
+
 # ========================================================================
 # HERO
 # ========================================================================
 
-@dataclass
+@dataclass(slots=True)
 class Hero:
     """
     Player character / ally representation for Nimble.
@@ -148,25 +172,48 @@ class Hero:
     @property
     def is_bloodied(self) -> bool:
         """True if HP is below bloodied threshold but above critical threshold."""
-        if self.hp_max <= 0:
+        hp_max = self.hp_max
+        if hp_max <= 0:
+            return False
+        hp = self.hp_current
+        if hp <= 0:
             return False
-        bloodied_threshold = self.hp_max * config.CONFIG.hero_bloodied_threshold
-        critical_threshold = self.hp_max * config.CONFIG.hero_critical_threshold
+        cfg = config.CONFIG
         # Bloodied is between critical and bloodied thresholds (not critical yet)
-        return self.hp_current > 0 and self.hp_current <= bloodied_threshold and self.hp_current > critical_threshold
+        return hp_max * cfg.hero_critical_threshold < hp <= hp_max * cfg.hero_bloodied_threshold
 
     @property
     def is_critical(self) -> bool:
         """True if HP is at or below critical threshold (but still alive)."""
-        if self.hp_max <= 0:
+        hp_max = self.hp_max
+        hp = self.hp_current
+        if hp_max <= 0 or hp <= 0:
             return False
-        threshold = self.hp_max * config.CONFIG.hero_critical_threshold
-        return self.hp_current > 0 and self.hp_current <= threshold
+        return hp <= hp_max * config.CONFIG.hero_critical_threshold
 
     @property
     def is_dying(self) -> bool:
         return self.hp_current <= 0
 
+    @property
+    def hp_status(self) -> str:
+        """
+        The HP band (HP_DOWN, HP_CRITICAL, HP_BLOODIED or HP_HEALTHY) in
+        one pass, for table colouring; same rules as the is_* flags.
+        """
+        hp = self.hp_current
+        if hp <= 0:
+            return HP_DOWN
+        hp_max = self.hp_max
+        if hp_max <= 0:
+            return HP_HEALTHY
+        cfg = config.CONFIG
+        if hp <= hp_max * cfg.hero_critical_threshold:
+            return HP_CRITICAL
+        if hp <= hp_max * cfg.hero_bloodied_threshold:
+            return HP_BLOODIED
+        return HP_HEALTHY
+
     # --------------------------------------------------------------------
     # HP / damage / healing
     # --------------------------------------------------------------------
@@ -177,49 +224,77 @@ class Hero:
             return
 
         # temp HP first
-        if self.temp_hp > 0:
-            used = min(self.temp_hp, amount)
-            self.temp_hp -= used
+        temp = self.temp_hp
+        if temp > 0:
+            used = temp if temp < amount else amount
+            self.temp_hp = temp - used
             amount -= used
 
-        # then real HP
+        # then real HP; clamp and Dying are decided on the same value
+        hp = self.hp_current
         if amount > 0:
-            self.hp_current -= amount
-            if self.hp_current < 0:
-                self.hp_current = 0
-        if self.hp_current > 0:
-            self.remove_condition("Dying")
-            return
-        self.add_condition("Dying")
+            hp -= amount
+            if hp < 0:
+                hp = 0
+            self.hp_current = hp
+        if hp > 0:
+            self._remove_condition_fast("Dying")
+        else:
+            self._add_condition_fast("Dying")
 
     def apply_healing(self, amount: int) -> None:
         """Heal real HP only, up to hp_max."""
         if amount <= 0:
             return
-        if self.hp_current <= 0 and self.hp_max > 0:
-            self.hp_current = 0
-
-        self.hp_current += amount
-        if self.hp_current > self.hp_max:
-            self.hp_current = self.hp_max
-        if self.hp_current > 0:
-            self.remove_condition("Dying")
-
-    def set_temp_hp(self, amount: int) -> None:
-        """Set temp HP directly (replace existing)."""
-        self.temp_hp = max(0, amount)
+        hp = self.hp_current
+        hp_max = self.hp_max
+        if hp <= 0 and hp_max > 0:
+            hp = 0
+
+        hp += amount
+        if hp > hp_max:
+            hp = hp_max
+        self.hp_current = hp
+        if hp > 0:
+            self._remove_condition_fast("Dying")
+
+    def set_temp_hp(self, amount: int) -> bool:
+        """Set temp HP directly (replace existing); True if it changed."""
+        if amount < 0:
+            amount = 0
+        if amount == self.temp_hp:
+            return False
+        self.temp_hp = amount
+        return True
 
     # --------------------------------------------------------------------
     # Conditions
     # --------------------------------------------------------------------
 
-    def add_condition(self, cond: str) -> None:
-        cond = cond.strip()
+    def add_condition(self, cond: str) -> bool:
+        """Add a condition; True if it was not already present."""
+        cond = sys.intern(cond.strip())
         if cond and cond not in self.conditions:
             self.conditions.append(cond)
+            return True
+        return False
+
+    def remove_condition(self, cond: str) -> bool:
+        """Remove a condition; True if it was present."""
+        # One scan: list.remove() already searches for the item.
+        try:
+            self.conditions.remove(cond.strip())
+        except ValueError:
+            return False
+        return True
+
+    # Internal fast paths for the fixed condition names used by the HP
+    # rules: no strip(), and no exception when the condition is absent.
+    def _add_condition_fast(self, cond: str) -> None:
+        if cond not in self.conditions:
+            self.conditions.append(cond)
 
-    def remove_condition(self, cond: str) -> None:
-        cond = cond.strip()
+    def _remove_condition_fast(self, cond: str) -> None:
         if cond in self.conditions:
             self.conditions.remove(cond)
 
@@ -228,18 +303,57 @@ class Hero:
     # --------------------------------------------------------------------
 
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        # Explicit fields: asdict() deep-copies and walks fields() per call.
+        # Only the list needs copying; everything else is immutable.
+        return {
+            "name": self.name,
+            "level": self.level,
+            "class_name": self.class_name,
+            "player": self.player,
+            "faction": self.faction,
+            "hp_max": self.hp_max,
+            "hp_current": self.hp_current,
+            "temp_hp": self.temp_hp,
+            "resource_1_name": self.resource_1_name,
+            "resource_1_current": self.resource_1_current,
+            "resource_1_max": self.resource_1_max,
+            "conditions": list(self.conditions),
+            "notes_public": self.notes_public,
+            "notes_gm": self.notes_gm,
+            "concentrating": self.concentrating,
+        }
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Hero":
-        return cls(**data)
+        # Fields are read by name, so unknown keys (like legacy "id") are ignored.
+        get = data.get
+        try:
+            return cls(
+                name=data["name"],
+                level=get("level", 1),
+                class_name=get("class_name", ""),
+                player=get("player", ""),
+                faction=get("faction", "Heroes"),
+                hp_max=get("hp_max", 10),
+                hp_current=get("hp_current", 10),
+                temp_hp=get("temp_hp", 0),
+                resource_1_name=get("resource_1_name", ""),
+                resource_1_current=get("resource_1_current", 0),
+                resource_1_max=get("resource_1_max", 0),
+                conditions=get("conditions", []),
+                notes_public=get("notes_public", ""),
+                notes_gm=get("notes_gm", ""),
+                concentrating=get("concentrating", False),
+            )
+        except KeyError as exc:
+            raise TypeError(f"Hero.from_dict() missing required field {exc}") from None
 
 
 # ========================================================================
 # MONSTER TEMPLATE
 # ========================================================================
 
-@dataclass
+@dataclass(slots=True)
 class MonsterTemplate:
     """
     Immutable "library" definition for a monster, as parsed from Nimble
@@ -269,18 +383,61 @@ class MonsterTemplate:
 
     # Serialization helpers for persistence
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        return {
+            "name": self.name,
+            "file": self.file,
+            "legendary": self.legendary,
+            "level": self.level,
+            "hp": self.hp,
+            "armor": self.armor,
+            "speed": self.speed,
+            "size": self.size,
+            "saves": self.saves,
+            "flavor": self.flavor,
+            "actions": list(self.actions),
+            "special_actions": list(self.special_actions),
+            "bloodied": self.bloodied,
+            "last_stand": self.last_stand,
+            "last_stand_hp": self.last_stand_hp,
+            "biome_loot": list(self.biome_loot),
+            "type": self.type,
+            "biome": self.biome,
+        }
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "MonsterTemplate":
-        return cls(**data)
+        # Fields are read by name, so unknown keys (like legacy "id") are ignored.
+        get = data.get
+        try:
+            return cls(
+                name=data["name"],
+                file=data["file"],
+                legendary=data["legendary"],
+                level=data["level"],
+                hp=data["hp"],
+                armor=data["armor"],
+                speed=data["speed"],
+                size=data["size"],
+                saves=data["saves"],
+                flavor=data["flavor"],
+                actions=data["actions"],
+                special_actions=data["special_actions"],
+                bloodied=data["bloodied"],
+                last_stand=data["last_stand"],
+                last_stand_hp=data["last_stand_hp"],
+                biome_loot=data["biome_loot"],
+                type=data["type"],
+                biome=data["biome"],
+            )
+        except KeyError as exc:
+            raise TypeError(f"MonsterTemplate.from_dict() missing required field {exc}") from None
 
 
 # ========================================================================
 # MONSTER INSTANCE
 # ========================================================================
 
-@dataclass
+@dataclass(slots=True)
 class MonsterInstance:
     """
     A single monster as it appears in an encounter.
@@ -345,12 +502,8 @@ class MonsterInstance:
             if isinstance(value, float):
                 return int(value)
             if isinstance(value, str):
-                value = value.strip()
-                if not value:
-                    return default
-                # Accept forms like "24", "24 HP", etc.
-                parts = value.split()
-                return int(parts[0])
+                parsed = _leading_int(value)
+                return default if parsed is None else parsed
         except Exception:
             return default
         return default
@@ -370,12 +523,14 @@ class MonsterInstance:
             size=tpl.size,
             saves=tpl.saves,
             flavor=tpl.flavor,
-            actions=list(tpl.actions),
-            special_actions=list(tpl.special_actions),
+            # Shared with the template: these lists are reference text,
+            # only ever replaced wholesale, never edited in place.
+            actions=tpl.actions,
+            special_actions=tpl.special_actions,
             bloodied_text=tpl.bloodied,
             last_stand_text=tpl.last_stand,
             last_stand_hp_value=last_stand_hp,
-            biome_loot=list(tpl.biome_loot),
+            biome_loot=tpl.biome_loot,
             type=tpl.type,
             biome=tpl.biome,
             hp_max=hp_max,
@@ -410,20 +565,43 @@ class MonsterInstance:
     @property
     def is_bloodied(self) -> bool:
         """True if HP is below bloodied threshold but above critical threshold."""
-        if self.hp_max <= 0:
+        hp_max = self.hp_max
+        if hp_max <= 0:
+            return False
+        hp = self.hp_current
+        if hp <= 0:
             return False
-        bloodied_threshold = self.hp_max * config.CONFIG.monster_bloodied_threshold
-        critical_threshold = self.hp_max * config.CONFIG.monster_critical_threshold
+        cfg = config.CONFIG
         # Bloodied is between critical and bloodied thresholds (not critical yet)
-        return self.hp_current > 0 and self.hp_current <= bloodied_threshold and self.hp_current > critical_threshold
+        return hp_max * cfg.monster_critical_threshold < hp <= hp_max * cfg.monster_bloodied_threshold
 
     @property
     def is_critical(self) -> bool:
         """True if HP is at or below critical threshold (but still alive/not in last stand)."""
-        if self.hp_max <= 0:
+        hp_max = self.hp_max
+        hp = self.hp_current
+        if hp_max <= 0 or hp <= 0:
             return False
-        threshold = self.hp_max * config.CONFIG.monster_critical_threshold
-        return self.hp_current > 0 and self.hp_current <= threshold
+        return hp <= hp_max * config.CONFIG.monster_critical_threshold
+
+    @property
+    def hp_status(self) -> str:
+        """
+        The HP band (HP_DOWN, HP_CRITICAL, HP_BLOODIED or HP_HEALTHY) in
+        one pass, for table colouring; same rules as the is_* flags.
+        """
+        if self.dead:
+            return HP_DOWN
+        hp = self.hp_current
+        hp_max = self.hp_max
+        if hp <= 0 or hp_max <= 0:
+            return HP_HEALTHY
+        cfg = config.CONFIG
+        if hp <= hp_max * cfg.monster_critical_threshold:
+            return HP_CRITICAL
+        if hp <= hp_max * cfg.monster_bloodied_threshold:
+            return HP_BLOODIED
+        return HP_HEALTHY
 
     # --------------------------------------------------------------------
     # HP / damage / healing with legendary last stand
@@ -435,18 +613,21 @@ class MonsterInstance:
             return
 
         # temp HP first
-        if self.temp_hp > 0:
-            used = min(self.temp_hp, amount)
-            self.temp_hp -= used
+        temp = self.temp_hp
+        if temp > 0:
+            used = temp if temp < amount else amount
+            self.temp_hp = temp - used
             amount -= used
 
         # then real HP
+        hp = self.hp_current
         if amount > 0:
-            self.hp_current -= amount
+            hp -= amount
+            self.hp_current = hp
 
         # Remove dying condition when still above 0
-        if self.hp_current > 0:
-            self.remove_condition("Dying")
+        if hp > 0:
+            self._remove_condition_fast("Dying")
             return
 
         # hp_current <= 0 here
@@ -456,39 +637,60 @@ class MonsterInstance:
             # If configured last stand HP is 0, fall back to 1
             self.hp_current = self.last_stand_hp_value or 1
             self.dead = False
-            self.add_condition("Last Stand")
-            self.remove_condition("Dying")
+            self._add_condition_fast("Last Stand")
+            self._remove_condition_fast("Dying")
         else:
             # Either not legendary, or last stand already used
             self.hp_current = 0
             self.dead = True
-            if "Last Stand" in self.conditions:
-                self.remove_condition("Last Stand")
+            self._remove_condition_fast("Last Stand")
 
     def apply_healing(self, amount: int) -> None:
         """Heal real HP only, up to hp_max. Does not resurrect dead monsters."""
         if amount <= 0 or self.dead:
             return
 
-        self.hp_current += amount
-        if self.hp_current > self.hp_max:
-            self.hp_current = self.hp_max
+        hp = self.hp_current + amount
+        hp_max = self.hp_max
+        self.hp_current = hp if hp < hp_max else hp_max
 
-    def set_temp_hp(self, amount: int) -> None:
-        """Set temp HP directly (replace existing)."""
-        self.temp_hp = max(0, amount)
+    def set_temp_hp(self, amount: int) -> bool:
+        """Set temp HP directly (replace existing); True if it changed."""
+        if amount < 0:
+            amount = 0
+        if amount == self.temp_hp:
+            return False
+        self.temp_hp = amount
+        return True
 
     # --------------------------------------------------------------------
     # Conditions
     # --------------------------------------------------------------------
 
-    def add_condition(self, cond: str) -> None:
-        cond = cond.strip()
+    def add_condition(self, cond: str) -> bool:
+        """Add a condition; True if it was not already present."""
+        cond = sys.intern(cond.strip())
         if cond and cond not in self.conditions:
             self.conditions.append(cond)
+            return True
+        return False
+
+    def remove_condition(self, cond: str) -> bool:
+        """Remove a condition; True if it was present."""
+        # One scan: list.remove() already searches for the item.
+        try:
+            self.conditions.remove(cond.strip())
+        except ValueError:
+            return False
+        return True
 
-    def remove_condition(self, cond: str) -> None:
-        cond = cond.strip()
+    # Internal fast paths for the fixed condition names used by the HP
+    # rules: no strip(), and no exception when the condition is absent.
+    def _add_condition_fast(self, cond: str) -> None:
+        if cond not in self.conditions:
+            self.conditions.append(cond)
+
+    def _remove_condition_fast(self, cond: str) -> None:
         if cond in self.conditions:
             self.conditions.remove(cond)
 
@@ -497,18 +699,89 @@ class MonsterInstance:
     # --------------------------------------------------------------------
 
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        return {
+            "name": self.name,
+            "template_file": self.template_file,
+            "legendary": self.legendary,
+            "level": self.level,
+            "armor": self.armor,
+            "speed": self.speed,
+            "size": self.size,
+            "saves": self.saves,
+            "flavor": self.flavor,
+            "actions": list(self.actions),
+            "special_actions": list(self.special_actions),
+            "bloodied_text": self.bloodied_text,
+            "last_stand_text": self.last_stand_text,
+            "last_stand_hp_value": self.last_stand_hp_value,
+            "biome_loot": list(self.biome_loot),
+            "type": self.type,
+            "biome": self.biome,
+            "hp_max": self.hp_max,
+            "hp_current": self.hp_current,
+            "temp_hp": self.temp_hp,
+            "last_stand_triggered": self.last_stand_triggered,
+            "dead": self.dead,
+            "group": self.group,
+            "active": self.active,
+            "concentrating": self.concentrating,
+            "conditions": list(self.conditions),
+            "notes_public": self.notes_public,
+            "notes_gm": self.notes_gm,
+            "marker_color": self.marker_color,
+            "marker_number": self.marker_number,
+            "shown_bloodied_popup": self.shown_bloodied_popup,
+            "shown_last_stand_popup": self.shown_last_stand_popup,
+        }
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "MonsterInstance":
-        return cls(**data)
+        # Fields are read by name, so unknown keys (like legacy "id") are ignored.
+        get = data.get
+        try:
+            return cls(
+                name=data["name"],
+                template_file=data["template_file"],
+                legendary=data["legendary"],
+                level=data["level"],
+                armor=data["armor"],
+                speed=data["speed"],
+                size=data["size"],
+                saves=data["saves"],
+                flavor=data["flavor"],
+                actions=get("actions", []),
+                special_actions=get("special_actions", []),
+                bloodied_text=get("bloodied_text", ""),
+                last_stand_text=get("last_stand_text", ""),
+                last_stand_hp_value=get("last_stand_hp_value", 0),
+                biome_loot=get("biome_loot", []),
+                type=get("type", ""),
+                biome=get("biome", ""),
+                hp_max=get("hp_max", 0),
+                hp_current=get("hp_current", 0),
+                temp_hp=get("temp_hp", 0),
+                last_stand_triggered=get("last_stand_triggered", False),
+                dead=get("dead", False),
+                group=get("group", ""),
+                active=get("active", True),
+                concentrating=get("concentrating", False),
+                conditions=get("conditions", []),
+                notes_public=get("notes_public", ""),
+                notes_gm=get("notes_gm", ""),
+                marker_color=get("marker_color", ""),
+                marker_number=get("marker_number", 0),
+                shown_bloodied_popup=get("shown_bloodied_popup", False),
+                shown_last_stand_popup=get("shown_last_stand_popup", False),
+            )
+        except KeyError as exc:
+            raise TypeError(f"MonsterInstance.from_dict() missing required field {exc}") from None
 
 
 # ========================================================================
 # PARTY & ENCOUNTER
 # ========================================================================
 
-@dataclass
+@dataclass(slots=True)
 class Party:
     """
     Named collection of heroes, saved/loaded as a unit.
@@ -525,13 +798,13 @@ class Party:
         return {
             "name": self.name,
             "notes": self.notes,
-            "heroes": [h.to_dict() for h in self.heroes],
+            "heroes": list(map(Hero.to_dict, self.heroes)),
         }
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Party":
         heroes_data = data.get("heroes", [])
-        heroes = [Hero.from_dict(hd) for hd in heroes_data]
+        heroes = list(map(Hero.from_dict, heroes_data))
         return cls(
             name=data.get("name", "Party"),
             heroes=heroes,
@@ -539,7 +812,7 @@ class Party:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Encounter:
     """
     Named collection of monster instances, saved/loaded as a unit.
@@ -556,13 +829,13 @@ class Encounter:
         return {
             "name": self.name,
             "notes": self.notes,
-            "monsters": [m.to_dict() for m in self.monsters],
+            "monsters": list(map(MonsterInstance.to_dict, self.monsters)),
         }
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Encounter":
         mons_data = data.get("monsters", [])
-        monsters = [MonsterInstance.from_dict(md) for md in mons_data]
+        monsters = list(map(MonsterInstance.from_dict, mons_data))
         return cls(
             name=data.get("name", "Encounter"),
             monsters=monsters,
@@ -2,7 +2,10 @@
 Condition descriptions for Nimble condition picker tooltips.
 """
 
-CONDITION_DESCRIPTIONS = {
+import sys
+from types import MappingProxyType
+
+_CONDITION_DESCRIPTIONS = {
     "Blinded": "Can't see. Attack rolls against the creature have advantage, and the creature's attack rolls have disadvantage.",
 
     "Charmed": "Sees the charmer as an ally. The charmer has advantage on social interactions with the creature.",
@@ -41,3 +44,9 @@ CONDITION_DESCRIPTIONS = {
 
     "Unconscious": "Incapacitated, can't move or speak, unaware of surroundings, drops whatever it's holding, and falls prone. Automatically fails Strength and Dexterity saves. Attack rolls against it have advantage and crit within 5 feet.",
 }
+
+# Read-only view with interned keys. Condition names added through
+# add_condition() are interned too, so tooltip lookups hit by identity.
+CONDITION_DESCRIPTIONS = MappingProxyType(
+    {sys.intern(name): text for name, text in _CONDITION_DESCRIPTIONS.items()}
+)
@@ -38,6 +38,8 @@
 from __future__ import annotations
 
 import json
+import os
+import time
 from dataclasses import dataclass, asdict, field
 from pathlib import Path
 from typing import List
@@ -55,19 +57,115 @@ PROJECT_ROOT = _get_project_root()
 CONFIG_POINTER_FILE = PROJECT_ROOT / "config_location.json"
 
 
-def _read_config_pointer() -> Path | None:
-    """Return the config path stored in the app directory pointer file."""
-    if not CONFIG_POINTER_FILE.exists():
-        return None
+# Vault and folder lookups repeat on every dialog and refresh; existence
+# answers are reused for a short TTL instead of stat-ing each time.
+_EXISTS_TTL = 1.0
+_exists_cache: dict[str, tuple[float, bool]] = {}
+
+
+def _exists_cached(p: Path) -> bool:
+    key = str(p)
+    now = time.monotonic()
+    hit = _exists_cache.get(key)
+    if hit is not None and now - hit[0] < _EXISTS_TTL:
+        return hit[1]
+    result = p.exists()
+    _exists_cache[key] = (now, result)
+    return result
+
+
+def invalidate_exists_cache() -> None:
+    """Forget cached existence checks, e.g. after creating vault folders."""
+    _exists_cache.clear()
+
+
+def _resolve_legacy_spelling(raw: str) -> str:
+    """Return raw, or its Beastiary/Bestiary twin when only that exists."""
+    p = Path(raw)
+    if _exists_cached(p):
+        return str(p)
+    # The alternate spelling is rarely needed; only build it on a miss.
+    if "Beastiary" in raw:
+        alt = Path(raw.replace("Beastiary", "Bestiary"))
+    elif "Bestiary" in raw:
+        alt = Path(raw.replace("Bestiary", "Beastiary"))
+    else:
+        return str(p)
+    if _exists_cached(alt):
+        return str(alt)
+    # Keep the raw path even if missing so UI can surface it.
+    return str(p)
+
+
+# ((mtime_ns, size), data) of the pointer file as last parsed.
+_pointer_cache: tuple | None = None
+
+
+def _invalidate_pointer_cache() -> None:
+    global _pointer_cache
+    _pointer_cache = None
+
+
+def _read_pointer_data() -> dict:
+    """Return the parsed pointer file (treat as read-only), or {}."""
+    global _pointer_cache
+    try:
+        # A missing file surfaces here, so no separate exists() check.
+        st = os.stat(CONFIG_POINTER_FILE)
+    except OSError:
+        return {}
+    version = (st.st_mtime_ns, st.st_size)
+    if _pointer_cache is not None and _pointer_cache[0] == version:
+        return _pointer_cache[1]
+
     try:
         # Keep the pointer as a tiny JSON file so we can evolve keys later.
-        data = json.loads(CONFIG_POINTER_FILE.read_text(encoding="utf-8"))
+        data = json.loads(CONFIG_POINTER_FILE.read_bytes())
     except Exception:  # noqa: BLE001
-        return None
-    raw = str(data.get("config_path", "")).strip()
-    if not raw:
-        return None
-    return Path(raw)
+        return {}
+    if not isinstance(data, dict):
+        data = {}
+    _pointer_cache = (version, data)
+    return data
+
+
+def _write_pointer_data(data: dict) -> None:
+    try:
+        _atomic_write_text(CONFIG_POINTER_FILE, json.dumps(data, indent=2))
+    except Exception:  # noqa: BLE001
+        pass
+    # Same-size rewrites within the mtime granularity would look unchanged.
+    _invalidate_pointer_cache()
+
+
+def _read_config_pointer() -> Path | None:
+    """Return the config path stored in the app directory pointer file."""
+    raw = str(_read_pointer_data().get("config_path", "")).strip()
+    return Path(raw) if raw else None
+
+
+def get_last_config_dir() -> Path | None:
+    """Return the folder last picked in the config prompts, if remembered."""
+    raw = str(_read_pointer_data().get("last_config_dir", "")).strip()
+    return Path(raw) if raw else None
+
+
+def set_last_config_dir(path: str | Path) -> None:
+    """
+    Remember the folder last picked in the config prompts. It is kept in
+    the pointer file, since the prompts only run when no config is loaded.
+    """
+    data = _read_pointer_data()
+    if data.get("last_config_dir") == str(path):
+        return
+    _write_pointer_data({**data, "last_config_dir": str(path)})
+
+
+def _atomic_write_text(p: Path, text: str) -> None:
+    """Write via a sibling temp file so a crash never leaves a torn file."""
+    tmp = p.with_name(p.name + ".tmp")
+    tmp.write_text(text, encoding="utf-8")
+    os.replace(tmp, p)
 
 
 def get_config_path() -> Path | None:
@@ -85,14 +183,12 @@ def get_config_path() -> Path | None:
 def set_config_path(path: str | Path) -> None:
     """Store the config path in CONFIG and in the app directory pointer file."""
     CONFIG.config_file_path = str(path)
-    try:
-        # Store only the path; keep this file stable for easy troubleshooting.
-        CONFIG_POINTER_FILE.write_text(
-            json.dumps({"config_path": str(path)}, indent=2),
-            encoding="utf-8",
-        )
-    except Exception:  # noqa: BLE001
-        pass
+    invalidate_exists_cache()
+    # Every load and save lands here; most of them re-store the same path.
+    if _read_config_pointer() == Path(path):
+        return
+    # Store only locations; keep this file stable for easy troubleshooting.
+    _write_pointer_data({**_read_pointer_data(), "config_path": str(path)})
 
 
 @dataclass
@@ -276,6 +372,10 @@ class TrackerConfig:
     difficulty_color_deadly: tuple = (170, 0, 0)     # Red
     difficulty_color_very_deadly: tuple = (100, 0, 100)  # Purple
 
+    # (raw string, parts) of the last vault path split; callers only read
+    # the list. Unannotated, so it is not a field and never reaches asdict().
+    _split_cache = None
+
     def resolve_monster_vault_path(self) -> str:
         """
         Return the configured monster vault path, falling back to the legacy
@@ -283,55 +383,34 @@ class TrackerConfig:
         """
         if not self.default_monster_vault_path:
             return ""
-        raw = self._split_monster_vault_paths()[0]
-        candidates = [Path(raw)]
-        if "Beastiary" in raw:
-            candidates.append(Path(raw.replace("Beastiary", "Bestiary")))
-        elif "Bestiary" in raw:
-            candidates.append(Path(raw.replace("Bestiary", "Beastiary")))
-        for candidate in candidates:
-            if candidate.exists():
-                return str(candidate)
-        return str(candidates[0])
+        return _resolve_legacy_spelling(self._split_monster_vault_paths()[0])
 
     def _split_monster_vault_paths(self) -> list[str]:
         """Split the configured monster vault paths into a list."""
-        raw = (self.default_monster_vault_path or "").strip()
-        if not raw:
-            return []
+        raw = self.default_monster_vault_path or ""
+        cached = self._split_cache
+        if cached is not None and cached[0] == raw:
+            return cached[1]
         parts = []
         for token in raw.replace("\n", ";").split(";"):
             # Normalize whitespace and ignore accidental double-separators.
             token = token.strip()
             if token:
                 parts.append(token)
+        self._split_cache = (raw, parts)
         return parts
 
     def resolve_monster_vault_paths(self) -> list[str]:
         """Return all configured monster vault paths with legacy fallbacks."""
-        resolved = []
-        for raw in self._split_monster_vault_paths():
-            # Support old folder naming typos for smoother migrations.
-            candidates = [Path(raw)]
-            if "Beastiary" in raw:
-                candidates.append(Path(raw.replace("Beastiary", "Bestiary")))
-            elif "Bestiary" in raw:
-                candidates.append(Path(raw.replace("Bestiary", "Beastiary")))
-            for candidate in candidates:
-                if candidate.exists():
-                    resolved.append(str(candidate))
-                    break
-            else:
-                # Keep the raw path even if missing so UI can surface it.
-                resolved.append(str(candidates[0]))
-        return resolved
+        # Support old folder naming typos for smoother migrations.
+        return [_resolve_legacy_spelling(raw) for raw in self._split_monster_vault_paths()]
 
     def get_encounter_folder(self) -> Path:
         """
         Get the encounter folder path, using Obsidian vault as base if configured.
         Returns an absolute Path object.
         """
-        if self.obsidian_vault_path and Path(self.obsidian_vault_path).exists():
+        if self.obsidian_vault_path and _exists_cached(Path(self.obsidian_vault_path)):
             base = Path(self.obsidian_vault_path)
             if self.default_encounter_folder:
                 # If relative path, join with vault base
@@ -357,7 +436,7 @@ class TrackerConfig:
         Get the party folder path, using Obsidian vault as base if configured.
         Returns an absolute Path object.
         """
-        if self.obsidian_vault_path and Path(self.obsidian_vault_path).exists():
+        if self.obsidian_vault_path and _exists_cached(Path(self.obsidian_vault_path)):
             base = Path(self.obsidian_vault_path)
             if self.default_party_folder:
                 folder_path = Path(self.default_party_folder)
@@ -381,7 +460,7 @@ class TrackerConfig:
         Get the combat log folder path, using Obsidian vault as base if configured.
         Returns an absolute Path object.
         """
-        if self.obsidian_vault_path and Path(self.obsidian_vault_path).exists():
+        if self.obsidian_vault_path and _exists_cached(Path(self.obsidian_vault_path)):
             base = Path(self.obsidian_vault_path)
             if self.default_combat_log_folder:
                 folder_path = Path(self.default_combat_log_folder)
@@ -430,7 +509,7 @@ class TrackerConfig:
             # Prioritize folders with "vault" in the name
             if "vault" in part_lower:
                 vault_path = Path(*path.parts[:i + 1])
-                if vault_path.exists() and vault_path.is_dir():
+                if _exists_cached(vault_path) and vault_path.is_dir():
                     # Give higher priority to folders with specific vault names
                     priority = 0
                     if "nimble" in part_lower or "obsidian" in part_lower:
@@ -456,7 +535,7 @@ class TrackerConfig:
             return
 
         vault = Path(self.obsidian_vault_path)
-        if not vault.exists():
+        if not _exists_cached(vault):
             return
 
         # Infer encounter folder if empty
@@ -465,7 +544,7 @@ class TrackerConfig:
             candidates = ["Encounters", "Sessions", "Campaign/Encounters"]
             for candidate in candidates:
                 test_path = vault / candidate
-                if test_path.exists():
+                if _exists_cached(test_path):
                     self.default_encounter_folder = candidate
                     break
             else:
@@ -477,7 +556,7 @@ class TrackerConfig:
             candidates = ["Heroes", "Party", "Characters", "Campaign/Heroes"]
             for candidate in candidates:
                 test_path = vault / candidate
-                if test_path.exists():
+                if _exists_cached(test_path):
                     self.default_party_folder = candidate
                     break
             else:
@@ -489,7 +568,7 @@ class TrackerConfig:
             candidates = ["Combat Logs", "Logs", "Campaign/Logs"]
             for candidate in candidates:
                 test_path = vault / candidate
-                if test_path.exists():
+                if _exists_cached(test_path):
                     self.default_combat_log_folder = candidate
                     break
             else:
@@ -570,8 +649,8 @@ def save_config(path: str | Path | None = None) -> None:
     p.parent.mkdir(parents=True, exist_ok=True)
     set_config_path(p)
     data = asdict(CONFIG)
-    with p.open("w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2)
+    # Encode once and write once rather than streaming through json.dump.
+    _atomic_write_text(p, json.dumps(data, indent=2))
 
 
 def load_config(path: str | Path | None = None) -> None:
@@ -590,8 +669,8 @@ def load_config(path: str | Path | None = None) -> None:
     if not p.is_file():
         return
 
-    with p.open("r", encoding="utf-8") as f:
-        raw = json.load(f)
+    # One read and a single parse of the bytes (json detects UTF-8).
+    raw = json.loads(p.read_bytes())
 
     if not isinstance(raw, dict):
         return
@@ -48,10 +48,19 @@
 # 4) Session Autosave JSON
 #    ----------------------
 #      {
+#          "generation": "snapshot id",
 #          "heroes":   [ HeroDict, ... ],
 #          "monsters": [ MonsterInstanceDict, ... ]
 #      }
 #
+#    Between full snapshots, changed rows are appended to a sidecar
+#    "<session file>.delta", one JSON object per line:
+#
+#      { "generation": "...", "heroes": { "index": HeroDict, ... },
+#        "monsters": { "index": MonsterInstanceDict, ... } }
+#
+#    Only lines carrying the snapshot's generation are replayed on load.
+#
 # For each Dict above, we only keep fields that are declared in the
 # corresponding dataclass. Unknown keys (like legacy "id") are ignored.
 #
@@ -62,7 +71,7 @@
 from __future__ import annotations
 
 import json
-from dataclasses import fields
+import uuid
 from pathlib import Path
 from typing import List, Tuple, Dict, Any
 
@@ -83,26 +92,23 @@ def _read_json(path: str | Path) -> Any:
     p = Path(path)
     if not p.is_file():
         raise FileNotFoundError(f"JSON file not found: {p}")
-    with p.open("r", encoding="utf-8") as f:
-        return json.load(f)
+    # One read and a single parse of the bytes (json detects UTF-8).
+    return json.loads(p.read_bytes())
 
 
-def _write_json(path: str | Path, data: Any) -> None:
+def _write_json(path: str | Path, data: Any, compact: bool = False) -> None:
     p = Path(path)
     # Always create the parent tree to avoid scattered caller checks.
     p.parent.mkdir(parents=True, exist_ok=True)
-    with p.open("w", encoding="utf-8") as f:
+    # Encode in one call and write once; json.dump() streams many small
+    # chunks through the pure-Python encoder and file layer.
+    if compact:
+        # Machine-only files: no indenting.
+        text = json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+    else:
         # Keep data human-readable; preserve any non-ASCII in names/notes.
-        json.dump(data, f, indent=2, ensure_ascii=False)
-
-
-def _filter_fields(data: Dict[str, Any], cls) -> Dict[str, Any]:
-    """
-    Return a copy of 'data' containing only keys that are dataclass
-    fields on 'cls'. This lets us safely ignore extra keys like "id".
-    """
-    valid = {f.name for f in fields(cls)}
-    return {k: v for k, v in data.items() if k in valid}
+        text = json.dumps(data, indent=2, ensure_ascii=False)
+    p.write_text(text, encoding="utf-8")
 
 
 # ========================================================================
@@ -119,42 +125,48 @@ def load_monster_library(path: str | Path) -> List[MonsterTemplate]:
         { "monsters": [ {...}, {...} ] }
         [ {...}, {...} ]
     """
-    raw = _read_json(path)
+    return monster_library_from_data(_read_json(path))
+
 
-    items = raw
+def _append_templates(
+    out: List[MonsterTemplate], entries: List[Any], legendary: bool
+) -> None:
+    """Build templates from entries, defaulting a missing "legendary" flag."""
+    from_dict = MonsterTemplate.from_dict
+    for entry in entries:
+        if not isinstance(entry, dict):
+            continue
+        if "legendary" not in entry:
+            # Copy only when needed; the caller's data is never modified.
+            entry = {"legendary": legendary, **entry}
+        out.append(from_dict(entry))
+
+
+def monster_library_from_data(raw: Any) -> List[MonsterTemplate]:
+    """
+    Build MonsterTemplate objects from already-parsed library data, in any
+    of the shapes accepted by load_monster_library(). The input is not
+    modified.
+    """
+    result: List[MonsterTemplate] = []
     if isinstance(raw, dict):
         # Support legacy layouts that split base/legendary lists.
         base_list = raw.get("monsters", [])
         legendary_list = raw.get("legendary_monsters", [])
         if isinstance(base_list, list) or isinstance(legendary_list, list):
-            merged = []
             if isinstance(base_list, list):
                 # Ensure legendary defaults to False for base monsters
-                for entry in base_list:
-                    if isinstance(entry, dict) and "legendary" not in entry:
-                        entry["legendary"] = False
-                merged.extend(base_list)
+                _append_templates(result, base_list, False)
             if isinstance(legendary_list, list):
                 # Ensure legendary defaults to True for legendary monsters
-                for entry in legendary_list:
-                    if isinstance(entry, dict) and "legendary" not in entry:
-                        entry["legendary"] = True
-                merged.extend(legendary_list)
-            items = merged
+                _append_templates(result, legendary_list, True)
+            return result
 
-    if not isinstance(items, list):
+    if not isinstance(raw, list):
         raise ValueError("Monster library JSON must be a list or have 'monsters' list.")
 
-    result: List[MonsterTemplate] = []
-    for entry in items:
-        if not isinstance(entry, dict):
-            continue
-        # Ensure legendary field exists with default False
-        if "legendary" not in entry:
-            entry["legendary"] = False
-        filtered = _filter_fields(entry, MonsterTemplate)
-        result.append(MonsterTemplate.from_dict(filtered))
-
+    # Ensure legendary field exists with default False
+    _append_templates(result, raw, False)
     return result
 
 
@@ -189,8 +201,7 @@ def load_party(path: str | Path) -> Party:
     for h in heroes_data:
         if not isinstance(h, dict):
             continue
-        filtered = _filter_fields(h, Hero)
-        heroes.append(Hero.from_dict(filtered))
+        heroes.append(Hero.from_dict(h))
 
     party = Party.new(raw.get("name", "Party"))
     party.notes = raw.get("notes", "")
@@ -200,7 +211,7 @@ def load_party(path: str | Path) -> Party:
 
 def save_party(path: str | Path, party: Party) -> None:
     """
-    Save a Party to a JSON file.
+    Save a Party to a JSON file. The party's hero list is only read.
     """
     data = party.to_dict()
     _write_json(path, data)
@@ -223,8 +234,7 @@ def load_encounter(path: str | Path) -> Encounter:
     for m in monsters_data:
         if not isinstance(m, dict):
             continue
-        filtered = _filter_fields(m, MonsterInstance)
-        monsters.append(MonsterInstance.from_dict(filtered))
+        monsters.append(MonsterInstance.from_dict(m))
 
     enc = Encounter.new(raw.get("name", "Encounter"))
     enc.notes = raw.get("notes", "")
@@ -234,7 +244,7 @@ def load_encounter(path: str | Path) -> Encounter:
 
 def save_encounter(path: str | Path, encounter: Encounter) -> None:
     """
-    Save an Encounter to a JSON file.
+    Save an Encounter to a JSON file. The monster list is only read.
     """
     data = encounter.to_dict()
     _write_json(path, data)
@@ -244,19 +254,82 @@ def save_encounter(path: str | Path, encounter: Encounter) -> None:
 # SESSION AUTOSAVE (HEROES + MONSTERS TOGETHER)
 # ========================================================================
 
+def _delta_path(path: str | Path) -> Path:
+    p = Path(path)
+    return p.with_name(p.name + ".delta")
+
+
 def autosave_session(
     heroes: List[Hero],
     monsters: List[MonsterInstance],
     path: str | Path,
-) -> None:
+) -> str:
     """
-    Save the current heroes + monsters as a session JSON file.
+    Save the current heroes + monsters as a full session JSON file and
+    start a fresh delta log. Returns the snapshot generation that later
+    append_session_delta() calls must pass.
     """
+    generation = uuid.uuid4().hex
     data = {
+        "generation": generation,
         "heroes": [h.to_dict() for h in heroes],
         "monsters": [m.to_dict() for m in monsters],
     }
-    _write_json(path, data)
+    _write_json(path, data, compact=True)
+    # Stale lines would be skipped anyway; this just keeps the file short.
+    try:
+        _delta_path(path).unlink()
+    except FileNotFoundError:
+        pass
+    return generation
+
+
+def append_session_delta(
+    path: str | Path,
+    generation: str,
+    heroes: Dict[int, Dict[str, Any]],
+    monsters: Dict[int, Dict[str, Any]],
+) -> None:
+    """
+    Append changed hero/monster rows (by list index) to the delta log of
+    the session snapshot at 'path'.
+    """
+    line = json.dumps(
+        {"generation": generation, "heroes": heroes, "monsters": monsters},
+        ensure_ascii=False,
+        separators=(",", ":"),
+    )
+    with _delta_path(path).open("a", encoding="utf-8") as f:
+        f.write(line + "\n")
+
+
+def _replay_session_deltas(raw: Dict[str, Any], path: Path) -> None:
+    """Apply the delta log for 'path' onto a parsed session snapshot."""
+    generation = raw.get("generation")
+    if not generation:
+        return
+    try:
+        lines = _delta_path(path).read_text(encoding="utf-8").splitlines()
+    except FileNotFoundError:
+        return
+
+    for line in lines:
+        try:
+            delta = json.loads(line)
+        except ValueError:
+            # A torn last line from an interrupted append; nothing follows.
+            break
+        if not isinstance(delta, dict) or delta.get("generation") != generation:
+            continue
+        for key in ("heroes", "monsters"):
+            rows = raw.get(key)
+            changed = delta.get(key)
+            if not isinstance(rows, list) or not isinstance(changed, dict):
+                continue
+            for index, row in changed.items():
+                i = int(index)
+                if 0 <= i < len(rows):
+                    rows[i] = row
 
 
 def load_session(path: str | Path) -> Tuple[List[Hero], List[MonsterInstance]]:
@@ -273,6 +346,7 @@ def load_session(path: str | Path) -> Tuple[List[Hero], List[MonsterInstance]]:
     raw = _read_json(p)
     if not isinstance(raw, dict):
         raise ValueError("Session JSON must be an object.")
+    _replay_session_deltas(raw, p)
 
     heroes_data = raw.get("heroes", [])
     monsters_data = raw.get("monsters", [])
@@ -283,13 +357,11 @@ def load_session(path: str | Path) -> Tuple[List[Hero], List[MonsterInstance]]:
     for h in heroes_data:
         if not isinstance(h, dict):
             continue
-        filtered = _filter_fields(h, Hero)
-        heroes.append(Hero.from_dict(filtered))
+        heroes.append(Hero.from_dict(h))
 
     for m in monsters_data:
         if not isinstance(m, dict):
             continue
-        filtered = _filter_fields(m, MonsterInstance)
-        monsters.append(MonsterInstance.from_dict(filtered))
+        monsters.append(MonsterInstance.from_dict(m))
 
     return heroes, monsters
@@ -127,9 +127,9 @@ class BestiaryTabController:
         if not paths:
             self.log("No default monster vault path set in config.")
             return
+        # Merge multiple libraries while deduplicating name/file pairs.
+        library: List[MonsterTemplate] = []
         try:
-            # Merge multiple libraries while deduplicating name/file pairs.
-            self.manager.monster_library = []
             seen = set()
             for path in paths:
                 templates = persistence.load_monster_library(path)
@@ -138,13 +138,16 @@ class BestiaryTabController:
                     if key in seen:
                         continue
                     seen.add(key)
-                    self.manager.monster_library.append(tpl)
+                    library.append(tpl)
                 self.log(
                     f"Monster vault loaded from config: {path} "
                     f"({len(templates)} templates)"
                 )
         except Exception as exc:
             self.log(f"ERROR loading monster vault(s) from config: {exc}")
+        finally:
+            # Assign once so the manager indexes the merged library.
+            self.manager.monster_library = library
 
     def populate_biome_filter(self) -> None:
         if self.combo_biome is None:
@@ -497,7 +500,7 @@ class BestiaryTabController:
     def _on_clear_encounter(self) -> None:
         self.manager.monsters.clear()
         if hasattr(self.manager, "_changed"):
-            self.manager._changed()
+            self.manager._changed(self.manager.CHANGE_MONSTERS)
         self.log("Encounter cleared (Bestiary tab).")
         self.refresh_encounter_table()
 
@@ -509,10 +512,11 @@ class BestiaryTabController:
         generated_monsters = show_random_encounter_dialog(parent_widget, self.manager)
 
         if generated_monsters:
-            # Add the generated monsters to the encounter
-            for template in generated_monsters:
-                group = template.biome or template.type or ""
-                self.manager.add_monster_from_template(template, group=group)
+            # Add the generated monsters to the encounter in one batch
+            self.manager.add_monsters_from_templates(
+                (template, template.biome or template.type or "")
+                for template in generated_monsters
+            )
 
             self.log(f"Random encounter generated: {len(generated_monsters)} monster(s) added.")
             self.refresh_encounter_table()
@@ -632,9 +636,9 @@ class BestiaryTabController:
                 monster.actions = template.actions
                 monster.special_actions = template.special_actions
                 monster.biome_loot = template.biome_loot
-                monster.bloodied = template.bloodied
-                monster.last_stand = template.last_stand
-                monster.last_stand_hp = int(template.last_stand_hp) if template.last_stand_hp else 0
+                monster.bloodied_text = template.bloodied
+                monster.last_stand_text = template.last_stand
+                monster.last_stand_hp_value = int(template.last_stand_hp) if template.last_stand_hp else 0
                 monster.legendary = template.legendary
                 updated_count += 1
 
@@ -667,23 +671,32 @@ class BestiaryTabController:
         if col < 0:
             return
 
-        # Create a widget container for centering
-        widget = QWidget()
-        checkbox = QCheckBox()
-        checkbox.setChecked(checked)
-
-        # Center the checkbox
-        layout = QHBoxLayout(widget)
-        layout.addWidget(checkbox)
-        layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        layout.setContentsMargins(0, 0, 0, 0)
-
-        # Connect checkbox to update monster state
-        checkbox.stateChanged.connect(
-            lambda state, r=row, c=col: self._on_checkbox_changed(r, c, state)
-        )
+        # Reuse the cell's checkbox from the last refresh instead of
+        # building a new widget tree for every row on every refresh.
+        widget = table.cellWidget(row, col)
+        checkbox = getattr(widget, "_checkbox", None)
+        if checkbox is None:
+            # Create a widget container for centering
+            widget = QWidget()
+            checkbox = QCheckBox()
+
+            # Center the checkbox
+            layout = QHBoxLayout(widget)
+            layout.addWidget(checkbox)
+            layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
+            layout.setContentsMargins(0, 0, 0, 0)
+
+            # Connect checkbox to update monster state
+            checkbox.stateChanged.connect(
+                lambda state, r=row, c=col: self._on_checkbox_changed(r, c, state)
+            )
+            widget._checkbox = checkbox
+            table.setCellWidget(row, col, widget)
 
-        table.setCellWidget(row, col, widget)
+        # Programmatic updates must not feed back into the manager.
+        checkbox.blockSignals(True)
+        checkbox.setChecked(checked)
+        checkbox.blockSignals(False)
 
     def _on_checkbox_changed(self, row: int, col: int, state: int) -> None:
         """Handle checkbox state changes and update monster data."""
@@ -698,7 +711,7 @@ class BestiaryTabController:
 
         # Notify manager of state change
         if hasattr(self.manager, "_changed"):
-            self.manager._changed()
+            self.manager._changed(self.manager.CHANGE_MONSTERS)
 
     def _show_context_menu(self, position) -> None:
         """Show context menu for bulk marker assignment."""
@@ -749,7 +762,7 @@ class BestiaryTabController:
 
             # Notify manager of state change
             if hasattr(self.manager, "_changed"):
-                self.manager._changed()
+                self.manager._changed(self.manager.CHANGE_MONSTERS)
 
     def _on_cell_double_clicked(self, row: int, col: int) -> None:
         """Handle double-clicks on table cells."""
@@ -775,7 +788,7 @@ class BestiaryTabController:
 
                 # Notify manager of state change
                 if hasattr(self.manager, "_changed"):
-                    self.manager._changed()
+                    self.manager._changed(self.manager.CHANGE_MONSTERS)
             return
 
         # Double-click on Marker column opens marker dialog
@@ -797,7 +810,7 @@ class BestiaryTabController:
 
                 # Notify manager of state change
                 if hasattr(self.manager, "_changed"):
-                    self.manager._changed()
+                    self.manager._changed(self.manager.CHANGE_MONSTERS)
 
     def _on_set_color_for_selected(self) -> None:
         """Set color for all selected monsters in the encounter table using bulk marker dialog."""
@@ -839,4 +852,4 @@ class BestiaryTabController:
 
             # Notify manager of state change
             if hasattr(self.manager, "_changed"):
-                self.manager._changed()
+                self.manager._changed(self.manager.CHANGE_MONSTERS)
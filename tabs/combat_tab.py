@@ -32,7 +32,12 @@ for _path in (PROJECT_ROOT,):
         sys.path.insert(0, str(_path))
 
 from modules.combatManager import CombatManager  # noqa: E402
-from modules.combatants import MonsterInstance  # noqa: E402
+from modules.combatants import (  # noqa: E402
+    HP_BLOODIED,
+    HP_CRITICAL,
+    HP_DOWN,
+    MonsterInstance,
+)
 from modules.config import CONFIG  # noqa: E402
 from tabs.marker_dialog import show_marker_dialog  # noqa: E402
 from tabs.bulk_marker_dialog import show_bulk_marker_dialog  # noqa: E402
@@ -256,7 +261,8 @@ class CombatTabController:
                 conditions = []
 
             # Create Tmp and Max items
-            self._set_item(row, COMBAT_COL_TMP, str(getattr(m, "temp_hp", 0)))
+            temp_hp = m.temp_hp
+            self._set_item(row, COMBAT_COL_TMP, str(temp_hp))
             self._set_item(row, COMBAT_COL_MAX, str(getattr(m, "hp_max", 0)))
 
             if name_item and is_legendary:
@@ -286,7 +292,7 @@ class CombatTabController:
             self._set_conditions_cell(row, conditions, COMBAT_COL_CONDS)
 
             # HP (effective_hp = current + temp), Temp, Max - with health state highlighting
-            hp_item = self._set_item(row, COMBAT_COL_HP, str(getattr(m, "effective_hp", 0)))
+            hp_item = self._set_item(row, COMBAT_COL_HP, str(m.hp_current + temp_hp))
             if hp_item:
                 # Make HP bold
                 font = QFont()
@@ -295,15 +301,16 @@ class CombatTabController:
                 hp_item.setFont(font)
 
                 # Determine health state and apply colors from CONFIG
-                if getattr(m, "is_dying", False) or getattr(m, "is_dead", False):
+                status = m.hp_status
+                if status == HP_DOWN:
                     # Down/Dead
                     hp_item.setBackground(QColor(*CONFIG.hp_down_color))
                     hp_item.setForeground(QColor("white"))
-                elif getattr(m, "is_critical", False):
+                elif status == HP_CRITICAL:
                     # Critical
                     hp_item.setBackground(QColor(*CONFIG.hp_critical_color))
                     hp_item.setForeground(QColor("white"))
-                elif getattr(m, "is_bloodied", False):
+                elif status == HP_BLOODIED:
                     # Bloodied
                     hp_item.setBackground(QColor(*CONFIG.hp_bloodied_color))
                     hp_item.setForeground(QColor("white"))
@@ -502,24 +509,36 @@ class CombatTabController:
         if col < 0:
             return
 
-        # Create a widget container for centering
-        widget = QWidget()
-        checkbox = QCheckBox()
-        checkbox.setChecked(checked)
-
-        # Center the checkbox
-        layout = QHBoxLayout(widget)
-        layout.addWidget(checkbox)
-        layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        layout.setContentsMargins(0, 0, 0, 0)
-
-        # Connect checkbox to update monster state
-        # Store monster reference with the checkbox to handle sorting correctly
-        checkbox.stateChanged.connect(
-            lambda state, m=monster, c=col: self._on_checkbox_changed_with_monster(m, c, state)
-        )
+        # Reuse the cell's checkbox from the last refresh instead of
+        # building a new widget tree for every row on every refresh.
+        widget = self.table.cellWidget(row, col)
+        checkbox = getattr(widget, "_checkbox", None)
+        if checkbox is None:
+            # Create a widget container for centering
+            widget = QWidget()
+            checkbox = QCheckBox()
+
+            # Center the checkbox
+            layout = QHBoxLayout(widget)
+            layout.addWidget(checkbox)
+            layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
+            layout.setContentsMargins(0, 0, 0, 0)
+
+            # Connect checkbox to update monster state. The monster is read
+            # from the checkbox at click time so rows can be rebound after sorting.
+            checkbox.stateChanged.connect(
+                lambda state, cb=checkbox, c=col: self._on_checkbox_changed_with_monster(
+                    cb._monster, c, state
+                )
+            )
+            widget._checkbox = checkbox
+            self.table.setCellWidget(row, col, widget)
 
-        self.table.setCellWidget(row, col, widget)
+        checkbox._monster = monster
+        # Programmatic updates must not feed back into the manager.
+        checkbox.blockSignals(True)
+        checkbox.setChecked(checked)
+        checkbox.blockSignals(False)
 
 
     def _set_conditions_cell(
@@ -562,7 +581,7 @@ class CombatTabController:
 
         # Notify manager of state change
         if hasattr(self.manager, "_changed"):
-            self.manager._changed()
+            self.manager._changed(self.manager.CHANGE_MONSTERS)
 
     def _on_checkbox_changed(self, row: int, col: int, state: int) -> None:
         """Handle checkbox state changes and update monster data (legacy handler)."""
@@ -578,7 +597,7 @@ class CombatTabController:
 
         # Notify manager of state change
         if hasattr(self.manager, "_changed"):
-            self.manager._changed()
+            self.manager._changed(self.manager.CHANGE_MONSTERS)
 
     def _on_cell_clicked(self, row: int, col: int) -> None:
         """Handle single clicks on table cells (for Heal and Hurt columns)."""
@@ -652,7 +671,7 @@ class CombatTabController:
                 monster.shown_bloodied_popup = False
                 monster.shown_last_stand_popup = False
 
-            # Notify manager of state change
+            # Notify manager of state change (heroes and monsters both reset)
             if hasattr(self.manager, "_changed"):
                 self.manager._changed()
 
@@ -713,7 +732,7 @@ class CombatTabController:
         """Clear all monsters from the encounter."""
         self.manager.monsters.clear()
         if hasattr(self.manager, "_changed"):
-            self.manager._changed()
+            self.manager._changed(self.manager.CHANGE_MONSTERS)
         self.refresh_table()
 
     def _on_set_color_for_selected(self) -> None:
@@ -757,7 +776,7 @@ class CombatTabController:
 
             self.refresh_table()
             if hasattr(self.manager, "_changed"):
-                self.manager._changed()
+                self.manager._changed(self.manager.CHANGE_MONSTERS)
 
     def _on_cell_double_clicked(self, row: int, col: int) -> None:
         """Handle double-click on a cell."""
@@ -779,7 +798,7 @@ class CombatTabController:
                 monster.marker_number = number
                 self.refresh_table()
                 if hasattr(self.manager, "_changed"):
-                    self.manager._changed()
+                    self.manager._changed(self.manager.CHANGE_MONSTERS)
             return
 
         if col == COMBAT_COL_CONDS:
@@ -793,7 +812,7 @@ class CombatTabController:
                 monster.conditions = result
                 self.refresh_table()
                 if hasattr(self.manager, "_changed"):
-                    self.manager._changed()
+                    self.manager._changed(self.manager.CHANGE_MONSTERS)
             return
 
         if self._dialog_open:
@@ -32,6 +32,7 @@ for _path in (PROJECT_ROOT,):
 
 from modules import config  # noqa: E402
 from modules.combatManager import CombatManager  # noqa: E402
+from modules.combatants import HP_BLOODIED, HP_CRITICAL, HP_DOWN  # noqa: E402
 from modules.config import CONFIG  # noqa: E402
 from tabs.conditions_dialog import show_conditions_dialog  # noqa: E402
 from tabs.damage_heal_dialog import show_damage_heal_dialog  # noqa: E402
@@ -186,7 +187,9 @@ class HeroesTabController:
             self._set_item(row, HERO_TAB_COL_PLAYER_NOTES, getattr(h, "notes_public", ""))
 
     def _set_hp_columns(self, row: int, hero) -> None:
-        hp_item = self._set_item(row, HERO_COL_HP, str(getattr(hero, "effective_hp", 0)))
+        # Effective HP (current + temp) inlined; temp is reused below.
+        temp_hp = hero.temp_hp
+        hp_item = self._set_item(row, HERO_COL_HP, str(hero.hp_current + temp_hp))
         if not hp_item:
             return
         font = QFont()
@@ -196,13 +199,14 @@ class HeroesTabController:
         # Ensure HP is center-aligned
         hp_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
 
-        if getattr(hero, "is_dying", False):
+        status = hero.hp_status
+        if status == HP_DOWN:
             hp_item.setBackground(QColor(*CONFIG.hp_down_color))
             hp_item.setForeground(QColor("white"))
-        elif getattr(hero, "is_critical", False):
+        elif status == HP_CRITICAL:
             hp_item.setBackground(QColor(*CONFIG.hp_critical_color))
             hp_item.setForeground(QColor("white"))
-        elif getattr(hero, "is_bloodied", False):
+        elif status == HP_BLOODIED:
             hp_item.setBackground(QColor(*CONFIG.hp_bloodied_color))
             hp_item.setForeground(QColor("white"))
         else:
@@ -210,7 +214,7 @@ class HeroesTabController:
             hp_item.setForeground(QColor("white"))
 
         # Set TMP and MAX columns with center alignment
-        tmp_item = self._set_item(row, HERO_COL_TMP, str(getattr(hero, "temp_hp", 0)))
+        tmp_item = self._set_item(row, HERO_COL_TMP, str(temp_hp))
         if tmp_item:
             tmp_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
 
@@ -349,22 +353,33 @@ class HeroesTabController:
         if col < 0:
             return
 
-        # Create a widget container for centering
-        widget = QWidget()
-        checkbox = QCheckBox()
-        checkbox.setChecked(checked)
-
-        # Center the checkbox
-        layout = QHBoxLayout(widget)
-        layout.addWidget(checkbox)
-        layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        layout.setContentsMargins(0, 0, 0, 0)
-
-        if hero is not None:
+        # Reuse the cell's checkbox from the last refresh instead of
+        # building a new widget tree for every row on every refresh.
+        widget = self.table.cellWidget(row, col)
+        checkbox = getattr(widget, "_checkbox", None)
+        if checkbox is None:
+            # Create a widget container for centering
+            widget = QWidget()
+            checkbox = QCheckBox()
+
+            # Center the checkbox
+            layout = QHBoxLayout(widget)
+            layout.addWidget(checkbox)
+            layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
+            layout.setContentsMargins(0, 0, 0, 0)
+
+            # The hero is read from the checkbox so the row can be rebound.
             checkbox.stateChanged.connect(
-                lambda state, h=hero: self._on_checkbox_changed_with_hero(h, state)
+                lambda state, cb=checkbox: self._on_checkbox_changed_with_hero(cb._hero, state)
             )
-        self.table.setCellWidget(row, col, widget)
+            widget._checkbox = checkbox
+            self.table.setCellWidget(row, col, widget)
+
+        checkbox._hero = hero
+        # Programmatic updates must not feed back into the manager.
+        checkbox.blockSignals(True)
+        checkbox.setChecked(checked)
+        checkbox.blockSignals(False)
 
     def _on_checkbox_changed_with_hero(self, hero, state: int) -> None:
         """Update hero state when concentration checkbox changes."""
@@ -372,7 +387,7 @@ class HeroesTabController:
             return
         hero.concentrating = (state == Qt.CheckState.Checked.value)
         if hasattr(self.manager, "_changed"):
-            self.manager._changed()
+            self.manager._changed(self.manager.CHANGE_HEROES)
 
     def _on_cell_double_clicked(self, row: int, col: int) -> None:
         """Handle double-clicks on table cells."""
@@ -395,7 +410,7 @@ class HeroesTabController:
 
                 # Notify manager of state change
                 if hasattr(self.manager, "_changed"):
-                    self.manager._changed()
+                    self.manager._changed(self.manager.CHANGE_HEROES)
             return
 
         # Only combat mode has a Conditions column
@@ -414,7 +429,7 @@ class HeroesTabController:
 
                 # Notify manager of state change
                 if hasattr(self.manager, "_changed"):
-                    self.manager._changed()
+                    self.manager._changed(self.manager.CHANGE_HEROES)
 
     def _notify_concentration_crit(self, creature) -> None:
         """Warn about the STR save when concentrating creatures suffer crit hits."""